@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Benchmark Suite
+Times each stage of the toolkit (workbook load, derived metrics, PV sweep,
+memo tables, each chart and the works-cited document) on the real data and
+on synthetic panels scaled up to 1k and 100k company-years
+
+Each run is appended to a JSON history together with the library versions it
+ran against, and the compare command flags scenarios that got slower than the
+previous run, so a pandas or matplotlib upgrade that slows the nightly build
+shows up as a named regression.
+"""
+
+import argparse
+import contextlib
+import csv
+import fnmatch
+import io
+import os
+import platform
+import runpy
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from ford_data_loader import (CACHE_DIR, WORKBOOK_PATH, _read_cache, _write_cache, atomic_write_json,
+                              load_financial_data, read_json)
+from ford_finance import pv_grid
+from ford_metrics import MEMO_RATIOS, OUTLINE_RATIOS, add_ratios
+from ford_panel import TICKER, synthetic_panel
+
+HISTORY_PATH = os.path.join(CACHE_DIR, 'benchmark_history.json')
+
+# Scale name -> number of company-years (None is the real 10-year workbook)
+SCALES = {'ford': None, '1k': 1_000, '100k': 100_000}
+
+# A scenario is flagged when its best time grows by more than THRESHOLD and
+# by at least MIN_DELTA seconds (so sub-millisecond jitter is ignored)
+THRESHOLD = 0.10
+MIN_DELTA = 0.005
+
+# Text-only commands that must start fast: label -> (argv, wall-time budget in
+# seconds). None of them may import a plotting library.
+STARTUP_BUDGETS = {
+    'outline --text-only': (['ford_analysis_per_outline.py', '--text-only'], 1.0),
+    'memo tables': (['generate_memo_tables.py'], 1.0),
+}
+PLOTTING_MODULES = ('matplotlib', 'seaborn')
+
+# Memo tables read straight from the (panel) DataFrame, and the formats timed
+MEMO_PANEL_TABLES = ['revenue', 'cash_flow', 'balance_sheet', 'liquidity']
+MEMO_FORMATS = ('grid', 'markdown', 'html')
+
+# name: benchmark label; prepare(df, workdir) -> zero-argument callable to time;
+# scales: the SCALES keys the scenario runs at
+Scenario = namedtuple('Scenario', ['name', 'prepare', 'scales'])
+
+
+def scaled_workbook(rows, seed=0):
+    """
+    Scale the workbook up to rows company-years: synthetic_panel issuers of
+    Ford's 10 years each, without the Ticker column so the frame has the
+    workbook's layout
+    """
+    years = len(load_financial_data())
+    panel = synthetic_panel(-(-rows // years), years, seed)
+    return panel.iloc[:rows].drop(columns=TICKER).reset_index(drop=True)
+
+
+def _prepare_load_workbook(df, workdir):
+    if len(df) == 10:
+        return lambda: pd.read_excel(WORKBOOK_PATH)
+    path = os.path.join(workdir, 'panel.xlsx')
+    df.to_excel(path, index=False)
+    return lambda: pd.read_excel(path)
+
+
+def _prepare_load_cached(df, workdir):
+    cache_file = os.path.join(workdir, 'panel.npz')
+    _write_cache(df, cache_file)
+    return lambda: _read_cache(cache_file)
+
+
+def _prepare_metrics(df, workdir):
+    return lambda: add_ratios(df.copy(), MEMO_RATIOS)
+
+
+def _prepare_pv_sweep(df, workdir):
+    # One payment per company-year against a 0-20% rate grid and the memo's terms
+    payments = df['Cash Flow from Ops ($B)'].to_numpy(dtype=np.float64)
+    rates = np.linspace(0.0, 0.20, 41)
+    years = np.array([12, 20])
+    return lambda: pv_grid(payments, rates, years)
+
+
+def _prepare_memo_script(df, workdir):
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path('generate_memo_tables.py', run_name='__main__')
+    return run
+
+
+def _prepare_memo_format(df, workdir):
+    from ford_tables import render_table
+    from generate_memo_tables import MEMO_TABLES
+
+    df = add_ratios(df.copy(), MEMO_RATIOS)
+
+    def run():
+        for name in MEMO_PANEL_TABLES:
+            render_table(MEMO_TABLES[name], df, MEMO_FORMATS)
+    return run
+
+
+def _prepare_panel_summary(df, workdir):
+    from ford_panel import outline_summary
+
+    # Every 10 company-years of the panel form one synthetic issuer
+    panel = add_ratios(df.copy(), OUTLINE_RATIOS)
+    panel[TICKER] = [f'C{i // 10:05d}' for i in range(len(panel))]
+    return lambda: outline_summary(panel)
+
+
+def _prepare_visual(number):
+    def prepare(df, workdir):
+        import matplotlib
+        matplotlib.use('Agg')
+        import ford_separate_visualizations as charts
+
+        charts.apply_style()
+        data = add_ratios(df.copy(), OUTLINE_RATIOS)
+        render = getattr(charts, f'render_visual_{number}')
+        path = os.path.join(workdir, f'visual_{number}.png')
+        return lambda: render(data, path)
+    return prepare
+
+
+def _prepare_works_cited(df, workdir):
+    import create_works_cited_v2
+
+    output = os.path.join(workdir, 'work-cited.docx')
+    citations = create_works_cited_v2.CITATIONS_PATH
+    if len(df) != 10:
+        # One synthetic 10-K citation per panel company-year
+        citations = os.path.join(workdir, 'citations.csv')
+        with open(citations, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['section', 'link_text', 'citation', 'url'])
+            for i, year in enumerate(df['Year Ended']):
+                writer.writerow(['SEC Form 10-K Annual Reports', '[View 10-K]',
+                                 f"Issuer {i // 10:05d}. ({year + 1}). Form 10-K for fiscal year "
+                                 f"ended December 31, {year}. U.S. Securities and Exchange Commission.",
+                                 f"https://www.sec.gov/Archives/edgar/data/{i}/10k-{year}.htm"])
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            create_works_cited_v2.create_works_cited(citations, output)
+    return run
+
+
+SCENARIOS = [
+    Scenario('load_workbook', _prepare_load_workbook, ['ford', '1k']),
+    Scenario('load_cached', _prepare_load_cached, ['ford', '1k', '100k']),
+    Scenario('metrics', _prepare_metrics, ['ford', '1k', '100k']),
+    Scenario('pv_sweep', _prepare_pv_sweep, ['ford', '1k', '100k']),
+    Scenario('memo_script', _prepare_memo_script, ['ford']),
+    Scenario('memo_format', _prepare_memo_format, ['ford', '1k', '100k']),
+    Scenario('panel_summary', _prepare_panel_summary, ['ford', '1k', '100k']),
+] + [
+    Scenario(f'visual_{n}', _prepare_visual(n), ['ford', '1k']) for n in range(1, 6)
+] + [
+    Scenario('works_cited', _prepare_works_cited, ['ford', '1k', '100k']),
+]
+
+
+def _library_versions():
+    versions = {'python': platform.python_version(), 'numpy': np.__version__,
+                'pandas': pd.__version__}
+    for module in ('matplotlib', 'seaborn', 'docx', 'tabulate', 'openpyxl'):
+        try:
+            versions[module] = getattr(__import__(module), '__version__', 'unknown')
+        except ImportError:
+            versions[module] = None
+    return versions
+
+
+def time_call(func, repeat):
+    """Return wall and CPU seconds for each of repeat calls (after one warm-up)"""
+    func()
+    wall, cpu = [], []
+    for _ in range(repeat):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        func()
+        wall.append(time.perf_counter() - wall_start)
+        cpu.append(time.process_time() - cpu_start)
+    return wall, cpu
+
+
+def run_benchmarks(scales=None, pattern='*', repeat=3, seed=0):
+    """
+    Run every matching scenario at each requested scale.
+
+    Returns {'scenario@scale': {'wall_min', 'wall_median', 'cpu_median',
+    'repeat', 'rows'}}.
+    """
+    scales = list(SCALES) if scales is None else scales
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for scale in scales:
+            rows = SCALES[scale]
+            df = load_financial_data() if rows is None else scaled_workbook(rows, seed)
+            for scenario in SCENARIOS:
+                if scale not in scenario.scales or not fnmatch.fnmatch(scenario.name, pattern):
+                    continue
+                func = scenario.prepare(df, workdir)
+                wall, cpu = time_call(func, repeat)
+                key = f'{scenario.name}@{scale}'
+                results[key] = {'wall_min': min(wall), 'wall_median': statistics.median(wall),
+                                'cpu_median': statistics.median(cpu), 'repeat': repeat,
+                                'rows': len(df)}
+                print(f"  {key:<24} {min(wall) * 1000:10.2f} ms", file=sys.stderr)
+    return results
+
+
+def measure_startup(argv, repeat=3):
+    """
+    Run a script in fresh interpreters with -X importtime.
+
+    Returns (median wall seconds, import seconds, plotting modules imported).
+    """
+    walls = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, '-X', 'importtime'] + argv, check=True,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        walls.append(time.perf_counter() - start)
+
+    # Lines look like "import time:  self [us] | cumulative | package"
+    import_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        import_us += int(self_us)
+        modules.add(name.strip())
+    plotting = sorted(name for name in modules if name.split('.')[0] in PLOTTING_MODULES)
+    return statistics.median(walls), import_us / 1e6, plotting
+
+
+def check_startup(budgets=STARTUP_BUDGETS, repeat=3):
+    """Measure each text-only command; returns a DataFrame with an 'ok' column"""
+    rows = []
+    for label, (argv, budget) in budgets.items():
+        wall, imports, plotting = measure_startup(argv, repeat)
+        rows.append({'command': label, 'wall_ms': wall * 1000, 'import_ms': imports * 1000,
+                     'budget_ms': budget * 1000, 'plotting_imported': ', '.join(plotting) or '-',
+                     'ok': wall <= budget and not plotting})
+    return pd.DataFrame(rows)
+
+
+def load_history(path=HISTORY_PATH):
+    return read_json(path, [])
+
+
+def append_history(results, path=HISTORY_PATH, label=None):
+    history = load_history(path)
+    history.append({'timestamp': datetime.now().isoformat(timespec='seconds'),
+                    'label': label, 'versions': _library_versions(), 'results': results})
+    atomic_write_json(path, history, indent=2)
+    return history
+
+
+def latest_results(runs):
+    """Merge runs oldest to newest, keeping each scenario's most recent result"""
+    merged = {'timestamp': runs[-1]['timestamp'] if runs else None,
+              'versions': runs[-1].get('versions', {}) if runs else {}, 'results': {}}
+    for run in runs:
+        merged['results'].update(run['results'])
+    return merged
+
+
+def compare_runs(baseline, current, threshold=THRESHOLD, min_delta=MIN_DELTA):
+    """
+    Compare the best wall times of two history entries.
+
+    Returns a DataFrame with one row per scenario present in both, sorted by
+    slowdown, and a boolean 'regression' column.
+    """
+    rows = []
+    for key in sorted(set(baseline['results']) & set(current['results'])):
+        before = baseline['results'][key]['wall_min']
+        after = current['results'][key]['wall_min']
+        ratio = after / before if before else np.inf
+        rows.append({'scenario': key, 'baseline_ms': before * 1000, 'current_ms': after * 1000,
+                     'change %': (ratio - 1) * 100,
+                     'regression': ratio > 1 + threshold and after - before >= min_delta})
+    table = pd.DataFrame(rows, columns=['scenario', 'baseline_ms', 'current_ms', 'change %',
+                                        'regression'])
+    return table.sort_values('change %', ascending=False, ignore_index=True)
+
+
+def _version_changes(baseline, current):
+    before, after = baseline.get('versions', {}), current.get('versions', {})
+    return {name: (before.get(name), after.get(name)) for name in sorted(set(before) | set(after))
+            if before.get(name) != after.get(name)}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the analysis toolkit")
+    parser.add_argument('--history', default=HISTORY_PATH, help="JSON file of past runs")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help="run the scenarios and record the results")
+    run_parser.add_argument('--scales', default=','.join(SCALES),
+                            help=f"comma-separated subset of {', '.join(SCALES)}")
+    run_parser.add_argument('--only', default='*', help="scenario name pattern, e.g. 'visual_*'")
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--label', help="note stored with the run (e.g. 'pandas 2.2')")
+
+    compare_parser = subparsers.add_parser('compare', help="flag regressions against an earlier run")
+    compare_parser.add_argument('--baseline', type=int,
+                                help="history index to compare against (default: each "
+                                     "scenario's most recent earlier result)")
+    compare_parser.add_argument('--current', type=int, default=-1)
+    compare_parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                                help="relative slowdown that counts as a regression")
+
+    subparsers.add_parser('list', help="list scenarios and scales")
+
+    startup_parser = subparsers.add_parser('startup', help="check text-only startup budgets")
+    startup_parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for scenario in SCENARIOS:
+            print(f"{scenario.name:<16} {', '.join(scenario.scales)}")
+    elif args.command == 'startup':
+        table = check_startup(repeat=args.repeat)
+        print(table.round(1).to_markdown(index=False, tablefmt="grid"))
+        failed = table[~table['ok']]
+        if len(failed):
+            print(f"\n✗ Over budget: {', '.join(failed['command'])}")
+            sys.exit(1)
+        print("\n✓ All text-only commands within budget")
+    elif args.command == 'run':
+        scales = [scale.strip() for scale in args.scales.split(',') if scale.strip()]
+        unknown = [scale for scale in scales if scale not in SCALES]
+        if unknown:
+            parser.error(f"unknown scale(s): {', '.join(unknown)}")
+        results = run_benchmarks(scales, args.only, args.repeat)
+        history = append_history(results, args.history, args.label)
+        print(f"✓ Recorded {len(results)} benchmark(s) as run #{len(history) - 1} in {args.history}")
+    else:
+        history = load_history(args.history)
+        if len(history) < 2:
+            sys.exit(f"Need at least two recorded runs in {args.history} to compare")
+        current = history[args.current]
+        if args.baseline is None:
+            baseline = latest_results(history[:history.index(current)])
+        else:
+            baseline = history[args.baseline]
+        table = compare_runs(baseline, current, args.threshold)
+        if table.empty:
+            sys.exit("The compared runs have no scenarios in common")
+        print(f"Baseline {baseline['timestamp']}  →  current {current['timestamp']}")
+        for name, (before, after) in _version_changes(baseline, current).items():
+            print(f"  {name}: {before} → {after}")
+        print(table.round(2).to_markdown(index=False, tablefmt="grid"))
+        regressions = table[table['regression']]
+        if len(regressions):
+            print(f"\n✗ {len(regressions)} regression(s): {', '.join(regressions['scenario'])}")
+            sys.exit(1)
+        print("\n✓ No regressions")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Incremental Build Cache
+Fingerprints each generated chart/table from the data slice it reads, its
+plotting code and its style parameters, and skips outputs whose fingerprint
+is unchanged since the last build
+"""
+
+import hashlib
+import inspect
+import json
+import os
+
+import pandas as pd
+
+from ford_data_loader import CACHE_DIR, atomic_write_json, read_json
+from ford_trace import span
+
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'build_manifest.json')
+
+
+def fingerprint(df, columns, code, params=None):
+    """
+    Hash everything an output depends on.
+
+    df/columns - the data slice the output reads (values and column names)
+    code       - a function or list of functions whose source is hashed
+    params     - JSON-serializable style/config parameters
+    """
+    digest = hashlib.sha256()
+
+    for col in columns:
+        digest.update(col.encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(df[col], index=False).to_numpy().tobytes())
+
+    functions = code if isinstance(code, (list, tuple)) else [code]
+    for func in functions:
+        digest.update(inspect.getsource(func).encode('utf-8'))
+
+    digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class BuildManifest:
+    """
+    Maps each output path to the fingerprint it was last built from.
+
+    The output's size and mtime are stored alongside, so a file overwritten
+    by another script (e.g. the narrative visuals share file names) is
+    treated as stale.
+    """
+
+    def __init__(self, path=MANIFEST_PATH):
+        self.path = path
+        # A missing or unreadable manifest treats every output as stale
+        self.entries = read_json(path, {})
+
+    @staticmethod
+    def _stat(output):
+        st = os.stat(output)
+        return [st.st_size, st.st_mtime_ns]
+
+    def is_fresh(self, output, digest):
+        entry = self.entries.get(output)
+        if not entry or not os.path.exists(output):
+            return False
+        return entry['fingerprint'] == digest and entry['stat'] == self._stat(output)
+
+    def record(self, output, digest):
+        self.entries[output] = {'fingerprint': digest, 'stat': self._stat(output)}
+
+    def save(self):
+        atomic_write_json(self.path, self.entries, indent=2, sort_keys=True)
+
+
+def build(output, func, df, columns, params=None, code=None, manifest=None, force=False):
+    """
+    Run func(df[columns], output, **params) only if the output is stale.
+
+    code defaults to func itself; pass a list to also fingerprint helpers the
+    output depends on. Returns True when the output was rebuilt.
+    """
+    params = params or {}
+    columns = list(columns)
+    digest = fingerprint(df, columns, code or func, params)
+
+    if manifest is None:
+        manifest = BuildManifest()
+        autosave = True
+    else:
+        autosave = False
+
+    if not force and manifest.is_fresh(output, digest):
+        return False
+
+    with span(f'build {output}'):
+        func(df[columns], output, **params)
+    manifest.record(output, digest)
+    if autosave:
+        manifest.save()
+    return True
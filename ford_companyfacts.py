@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - SEC Companyfacts Ingestion
+Streams a local mirror of the SEC XBRL "companyfacts" bulk JSON (a directory
+of CIK##########.json files or the companyfacts.zip archive itself), maps
+us-gaap tags to the ratio workbook's input columns and writes one row per
+(issuer, fiscal year) to the loader's columnar .npz store
+
+Each file is parsed incrementally, one us-gaap concept at a time, and only
+annual USD facts of the mapped tags are kept, so memory is bounded by the
+largest single concept rather than the file. Files are spread over a process
+pool. Requires the optional ijson package.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from ford_data_loader import CACHE_DIR, _write_cache
+from ford_panel import TICKER, as_panel
+from ford_pdf_extract import INPUT_COLUMNS
+
+try:
+    import ijson
+except ImportError:  # optional: only needed for companyfacts ingestion
+    ijson = None
+
+COMPANYFACTS_PATH = 'companyfacts'
+STORE_PATH = os.path.join(CACHE_DIR, 'companyfacts.npz')
+
+# Column -> candidate us-gaap tags; for each fiscal year the first candidate
+# reported wins. A tuple of tags is summed (every part must be reported).
+# Keys starting with '_' are intermediate values used to derive other columns.
+GAAP_TAGS = {
+    'Revenue ($B)': ['Revenues', 'RevenueFromContractWithCustomerExcludingAssessedTax',
+                     'SalesRevenueNet'],
+    'COGS ($B)': ['CostOfGoodsAndServicesSold', 'CostOfRevenue', 'CostOfGoodsSold'],
+    'Operating Income ($B)': ['OperatingIncomeLoss'],
+    'Net Income ($B)': ['NetIncomeLoss', 'ProfitLoss'],
+    'Interest Expense ($B)': ['InterestExpense', 'InterestExpenseDebt'],
+    'Income Tax Expense ($B)': ['IncomeTaxExpenseBenefit'],
+    '_pretax': ['IncomeLossFromContinuingOperationsBeforeIncomeTaxesExtraordinaryItemsNoncontrollingInterest',
+                'IncomeLossFromContinuingOperationsBeforeIncomeTaxesMinorityInterestAndIncomeLossFromEquityMethodInvestments'],
+    'Total Assets ($B)': ['Assets'],
+    'Total Liabilities ($B)': ['Liabilities'],
+    'Shareholders Equity ($B)': ['StockholdersEquityIncludingPortionAttributableToNoncontrollingInterest',
+                                 'StockholdersEquity'],
+    'Cash & Equivalents ($B)': ['CashAndCashEquivalentsAtCarryingValue'],
+    'Current Assets ($B)': ['AssetsCurrent'],
+    'Inventory ($B)': ['InventoryNet'],
+    'Current Liabilities ($B)': ['LiabilitiesCurrent'],
+    'Total Debt ($B)': ['DebtAndCapitalLeaseObligations', 'LongTermDebt',
+                        ('DebtCurrent', 'LongTermDebtNoncurrent'),
+                        ('LongTermDebtCurrent', 'LongTermDebtNoncurrent')],
+    'Cash Flow from Ops ($B)': ['NetCashProvidedByUsedInOperatingActivities'],
+    'Capex ($B)': ['PaymentsToAcquirePropertyPlantAndEquipment',
+                   'PaymentsToAcquireProductiveAssets'],
+}
+
+# Balance-sheet columns are point-in-time (instant) facts; the rest are
+# flows reported over a fiscal year
+INSTANT_COLUMNS = {'Total Assets ($B)', 'Total Liabilities ($B)', 'Shareholders Equity ($B)',
+                   'Cash & Equivalents ($B)', 'Current Assets ($B)', 'Inventory ($B)',
+                   'Current Liabilities ($B)', 'Total Debt ($B)'}
+
+ANNUAL_FORMS = {'10-K', '10-K/A', '20-F', '40-F'}
+ANNUAL_DAYS = (350, 380)
+
+INSTANT_TAGS = {tag for column in INSTANT_COLUMNS for candidate in GAAP_TAGS[column]
+                for tag in (candidate if isinstance(candidate, tuple) else (candidate,))}
+WANTED_TAGS = {tag for candidates in GAAP_TAGS.values() for candidate in candidates
+               for tag in (candidate if isinstance(candidate, tuple) else (candidate,))}
+
+_CIK = re.compile(r'CIK(\d{10})\.json$')
+
+# Per-process open archives, so a worker reads many members of one zip
+# without re-reading its central directory each time
+_ARCHIVES = {}
+
+
+def _require_ijson():
+    if ijson is None:
+        raise ImportError("Companyfacts ingestion requires ijson: pip install ijson")
+
+
+def _fiscal_year(end):
+    """Fiscal year of a period ending on end (YYYY-MM-DD); January year-ends
+    belong to the previous year, as retailers report them"""
+    year, month = int(end[:4]), int(end[5:7])
+    return year - 1 if month == 1 else year
+
+
+def _annual_values(facts, instant):
+    """
+    {fiscal year: value} from one concept's USD facts.
+
+    Only facts filed on annual forms count: full-year durations for flows,
+    period-end instants for balance-sheet items. When a year is reported more
+    than once, the filing for that year beats later comparatives, then the
+    latest amendment wins.
+    """
+    best = {}
+    for fact in facts:
+        if fact.get('form') not in ANNUAL_FORMS or fact.get('fp') != 'FY':
+            continue
+        end = fact['end']
+        start = fact.get('start')
+        if instant:
+            if start is not None:
+                continue
+        else:
+            if start is None:
+                continue
+            days = (date.fromisoformat(end) - date.fromisoformat(start)).days
+            if not ANNUAL_DAYS[0] <= days <= ANNUAL_DAYS[1]:
+                continue
+        year = _fiscal_year(end)
+        rank = (fact.get('fy') == year, fact.get('filed', ''))
+        if year not in best or rank > best[year][0]:
+            best[year] = (rank, fact['val'])
+    return {year: value for year, (_, value) in best.items()}
+
+
+def _open(source):
+    """Binary stream for a file path or an (archive path, member) pair"""
+    if isinstance(source, str):
+        return open(source, 'rb')
+    archive_path, member = source
+    archive = _ARCHIVES.get(archive_path)
+    if archive is None:
+        archive = _ARCHIVES[archive_path] = zipfile.ZipFile(archive_path)
+    return archive.open(member)
+
+
+def _source_name(source):
+    return source if isinstance(source, str) else source[1]
+
+
+def extract_companyfacts(source):
+    """
+    Annual rows for one companyfacts file.
+
+    Returns a list of row dicts with 'CIK', 'Year Ended' and the mapped
+    INPUT_COLUMNS in $B. Concepts are streamed one at a time and unmapped
+    ones are discarded as soon as they are parsed.
+    """
+    _require_ijson()
+    match = _CIK.search(_source_name(source))
+    tagged = {}
+    with _open(source) as f:
+        for tag, concept in ijson.kvitems(f, 'facts.us-gaap', use_float=True):
+            if tag in WANTED_TAGS:
+                tagged[tag] = _annual_values(concept.get('units', {}).get('USD', []),
+                                             tag in INSTANT_TAGS)
+    if not tagged:
+        return []
+
+    columns = {}
+    for column, candidates in GAAP_TAGS.items():
+        values = columns[column] = {}
+        for candidate in candidates:
+            parts = candidate if isinstance(candidate, tuple) else (candidate,)
+            if not all(tag in tagged for tag in parts):
+                continue
+            years = set.intersection(*(set(tagged[tag]) for tag in parts))
+            for year in years - values.keys():
+                values[year] = sum(tagged[tag][year] for tag in parts)
+
+    cik = int(match.group(1)) if match else None
+    rows = []
+    for year in sorted(set().union(*(values.keys() for values in columns.values()))):
+        row = {'CIK': cik, 'Year Ended': year}
+        row.update({column: values[year] / 1e9 for column, values in columns.items()
+                    if year in values})
+        # Same derivations as the PDF extraction
+        if '_pretax' in row:
+            pretax = row.pop('_pretax')
+            row['EBIT ($B)'] = pretax + row.get('Interest Expense ($B)', 0.0)
+        if 'Capex ($B)' in row:
+            row['Capex ($B)'] = abs(row['Capex ($B)'])
+        rows.append(row)
+    return rows
+
+
+def list_sources(path=COMPANYFACTS_PATH, ciks=None):
+    """companyfacts files under a directory or inside a zip, optionally only the given CIKs"""
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            names = [name for name in archive.namelist() if name.endswith('.json')]
+        sources = [(path, name) for name in sorted(names)]
+    else:
+        sources = sorted(glob.glob(os.path.join(path, '*.json')))
+    if ciks:
+        wanted = {f"CIK{int(cik):010d}.json" for cik in ciks}
+        sources = [source for source in sources
+                   if os.path.basename(_source_name(source)) in wanted]
+    return sources
+
+
+def load_ticker_map(path):
+    """{CIK: ticker} from the SEC company_tickers.json file"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    tickers = {}
+    for entry in data.values():
+        # The file lists share classes separately; keep each CIK's first ticker
+        tickers.setdefault(int(entry['cik_str']), entry['ticker'])
+    return tickers
+
+
+def ingest_companyfacts(sources, workers=1, tickers=None, chunksize=16):
+    """
+    Extract every companyfacts source, in a process pool when workers > 1.
+
+    Returns a panel with a Ticker column (from tickers, else 'CIK##########'),
+    CIK and INPUT_COLUMNS, one row per issuer and fiscal year. Columns an
+    issuer does not report are left as NaN.
+    """
+    _require_ijson()
+    if workers <= 1:
+        results = map(extract_companyfacts, sources)
+        rows = [row for result in results for row in result]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(extract_companyfacts, sources, chunksize=chunksize)
+            rows = [row for result in results for row in result]
+
+    df = pd.DataFrame(rows).reindex(columns=['CIK'] + INPUT_COLUMNS)
+    df = df.dropna(subset=['CIK'])
+    df['CIK'] = df['CIK'].astype(np.int64)
+    df['Year Ended'] = df['Year Ended'].astype(np.int64)
+    numeric = INPUT_COLUMNS[1:]
+    df[numeric] = np.round(df[numeric].astype(float), 2)
+    tickers = tickers or {}
+    df.insert(0, TICKER, [tickers.get(cik) or f"CIK{cik:010d}" for cik in df['CIK']])
+    return as_panel(df)
+
+
+def write_store(df, path=STORE_PATH):
+    """Write the panel to the loader's columnar .npz format"""
+    _write_cache(df, path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ingest SEC companyfacts JSON into the columnar store")
+    parser.add_argument('source', nargs='?', default=COMPANYFACTS_PATH,
+                        help="directory of CIK##########.json files or companyfacts.zip")
+    parser.add_argument('--cik', type=int, action='append',
+                        help="only ingest this CIK (repeatable; Ford is 37996)")
+    parser.add_argument('--tickers', help="SEC company_tickers.json, to label issuers by ticker")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="number of parsing processes (1 runs serially)")
+    parser.add_argument('--output', default=STORE_PATH, help="columnar .npz store to write")
+    args = parser.parse_args()
+
+    sources = list_sources(args.source, args.cik)
+    tickers = load_ticker_map(args.tickers) if args.tickers else None
+    start = time.perf_counter()
+    panel = ingest_companyfacts(sources, workers=args.workers, tickers=tickers)
+    write_store(panel, args.output)
+    elapsed = time.perf_counter() - start
+    print(f"✓ {len(sources):,} companyfacts files → {panel[TICKER].nunique():,} issuers, "
+          f"{len(panel):,} fiscal years in {elapsed:.1f}s")
+    print(f"✓ Store: {args.output}")
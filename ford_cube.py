@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Metric Cube
+Stores a panel as one contiguous company × year × metric NumPy array, with a
+schema registry mapping display labels such as 'Cash Flow from Ops ($B)' to
+integer metric IDs
+
+The array is Fortran-ordered, so each metric's company × year plane is one
+contiguous block: metric, company and year slices are views, never copies.
+Derived ratios are computed straight into reserved planes. At float32 the
+cube takes a fraction of the memory of the equivalent DataFrame with its
+ticker strings, index and per-script copies.
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from ford_metrics import RATIO_REGISTRY
+from ford_panel import TICKER, YEAR, as_panel
+
+
+class MetricSchema:
+    """
+    Registry of metric labels and their integer IDs (positions on the
+    cube's metric axis). IDs are assigned in registration order and never
+    change, so cubes built from one schema share the same layout.
+    """
+
+    def __init__(self, labels=()):
+        self.labels = []
+        self.ids = {}
+        for label in labels:
+            self.register(label)
+
+    def register(self, label):
+        """Return label's ID, assigning the next free one if it is new"""
+        if label not in self.ids:
+            self.ids[label] = len(self.labels)
+            self.labels.append(label)
+        return self.ids[label]
+
+    def id(self, label):
+        try:
+            return self.ids[label]
+        except KeyError:
+            raise KeyError(f"Unknown metric: {label!r}") from None
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __contains__(self, label):
+        return label in self.ids
+
+    def __iter__(self):
+        return iter(self.labels)
+
+
+class MetricCube:
+    """
+    values[company, year, metric] with the tickers, fiscal years and schema
+    labelling each axis. Missing company-years are NaN.
+    """
+
+    def __init__(self, values, tickers, years, schema):
+        self.values = values
+        self.tickers = np.asarray(tickers)
+        self.years = np.asarray(years)
+        self.schema = schema
+        self._company_ids = {ticker: i for i, ticker in enumerate(self.tickers.tolist())}
+        self._year_ids = {int(year): j for j, year in enumerate(self.years.tolist())}
+
+    @classmethod
+    def from_panel(cls, df, metrics=None, ratios=(), dtype=np.float32, schema=None):
+        """
+        Build a cube from a (Ticker, Year Ended) panel or a single-issuer frame.
+
+        metrics defaults to every numeric column; ratios are RATIO_REGISTRY
+        names given planes of their own and computed from the cube. Pass a
+        shared schema to keep metric IDs identical across cubes.
+        """
+        df = as_panel(df)
+        if metrics is None:
+            metrics = [col for col in df.columns
+                       if col not in (TICKER, YEAR) and df[col].dtype.kind in 'iuf']
+        schema = schema if schema is not None else MetricSchema()
+        for label in list(metrics) + list(ratios):
+            schema.register(label)
+
+        company_ids, tickers = pd.factorize(df[TICKER], sort=True)
+        years = np.unique(df[YEAR].to_numpy())
+        year_ids = np.searchsorted(years, df[YEAR].to_numpy())
+
+        values = np.full((len(tickers), len(years), len(schema)), np.nan, dtype=dtype, order='F')
+        for label in metrics:
+            values[company_ids, year_ids, schema.id(label)] = df[label].to_numpy()
+        cube = cls(values, tickers.to_numpy(), years, schema)
+        if ratios:
+            cube.compute_ratios(ratios)
+        return cube
+
+    def compute_ratios(self, names):
+        """
+        Evaluate RATIO_REGISTRY formulas plane by plane, writing each result
+        into the ratio's own plane (reserved by from_panel's ratios argument)
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for name in names:
+                ratio = RATIO_REGISTRY[name]
+                inputs = [self.metric(label) for label in ratio.inputs]
+                self.metric(name)[...] = ratio.formula(*inputs)
+        return self
+
+    def metric(self, label):
+        """company × year plane of one metric (a contiguous view); label may be an ID"""
+        index = label if isinstance(label, (int, np.integer)) else self.schema.id(label)
+        return self.values[:, :, index]
+
+    def company(self, ticker):
+        """year × metric view of one issuer"""
+        return self.values[self._company_ids[ticker]]
+
+    def year(self, year):
+        """company × metric view of one fiscal year"""
+        return self.values[:, self._year_ids[int(year)]]
+
+    def metrics(self, labels):
+        """
+        company × year × len(labels) array of several metrics. A run of
+        consecutive IDs is returned as a view; any other selection is copied.
+        """
+        ids = [self.schema.id(label) for label in labels]
+        if ids == list(range(ids[0], ids[0] + len(ids))):
+            return self.values[:, :, ids[0]:ids[0] + len(ids)]
+        return self.values[:, :, ids]
+
+    def to_frame(self, ticker):
+        """One issuer as a DataFrame shaped like the workbook (Year Ended + metrics)"""
+        frame = pd.DataFrame(self.company(ticker), columns=self.schema.labels)
+        frame.insert(0, YEAR, self.years)
+        return frame.dropna(how='all', subset=self.schema.labels).reset_index(drop=True)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def __repr__(self):
+        companies, years, metrics = self.values.shape
+        return (f"MetricCube({companies} companies × {years} years × {metrics} metrics, "
+                f"{self.values.dtype}, {self.nbytes / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    from ford_metrics import MEMO_RATIOS, add_ratios
+    from ford_panel import synthetic_panel
+
+    parser = argparse.ArgumentParser(description="Compare a metric cube with the DataFrame it replaces")
+    parser.add_argument('--companies', type=int, default=500)
+    parser.add_argument('--years', type=int, default=20)
+    parser.add_argument('--dtype', choices=['float32', 'float64'], default='float32')
+    args = parser.parse_args()
+
+    panel = synthetic_panel(args.companies, args.years)
+    cube = MetricCube.from_panel(panel, ratios=MEMO_RATIOS, dtype=args.dtype)
+    frame = add_ratios(panel.copy(), MEMO_RATIOS)
+    frame_bytes = frame.memory_usage(deep=True).sum()
+
+    print(f"✓ {cube!r}")
+    print(f"✓ DataFrame: {frame_bytes / 1e6:.1f} MB → cube {cube.nbytes / 1e6:.1f} MB "
+          f"({frame_bytes / cube.nbytes:.1f}× smaller)")
+    plane = cube.metric('Free Cash Flow ($B)')
+    print(f"✓ Metric planes are views: {np.shares_memory(plane, cube.values)}, "
+          f"contiguous: {plane.flags['F_CONTIGUOUS']}")
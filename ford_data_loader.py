@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Shared Data Loader
+Parses the 10-K ratio workbook once and caches it as a columnar .npz file
+keyed by the workbook's content hash
+
+Fiscal years filed after the workbook was built are appended to a small CSV
+(see ford_incremental.py) and merged in on load, so a new 10-K never forces
+the spreadsheet to be edited or re-parsed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from ford_trace import traced
+
+WORKBOOK_PATH = 'Ford_10K_Financial_Ratios_2015_2024.xlsx'
+APPENDED_YEARS_PATH = 'Ford_10K_Appended_Years.csv'
+CACHE_DIR = '.ford_cache'
+
+# Bump when the cache layout changes so old files are never misread
+CACHE_VERSION = 1
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """Return the SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_json(path, default=None):
+    """path's JSON content, or default when it is missing or unreadable"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def atomic_write_json(path, data, **dump_options):
+    """
+    Write data to path as JSON (dump_options go to json.dump) so readers only
+    ever see the old or the new file. Each write goes through its own
+    temporary file in path's directory, so concurrent writers never clobber
+    each other's half-written output; the last os.replace wins.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    # Temporary files are created 0600; keep the existing file's permissions
+    mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directory, delete=False,
+                                      prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with tmp:
+            json.dump(data, tmp, **dump_options)
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        if os.path.exists(tmp.name):
+            os.remove(tmp.name)
+        raise
+
+
+def workbook_hash(path=WORKBOOK_PATH):
+    """Return the SHA-256 hex digest of the workbook bytes"""
+    return file_hash(path)
+
+
+def _cache_path(path, content_hash, cache_dir):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-v{CACHE_VERSION}-{content_hash[:16]}.npz")
+
+
+def _write_cache(df, cache_file):
+    """Store each column as its own array so loads never touch openpyxl"""
+    arrays = {}
+    for i, col in enumerate(df.columns):
+        values = df[col].to_numpy()
+        # Text columns (e.g. a panel's tickers) as fixed-width strings, which
+        # load without pickle
+        arrays[f"col_{i}"] = values.astype(str) if values.dtype == object else values
+    arrays['__columns__'] = np.array(df.columns, dtype=str)
+
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        np.savez(f, **arrays)
+    # Atomic rename so a concurrent reader never sees a half-written cache
+    os.replace(tmp_file, cache_file)
+
+
+def _read_cache(cache_file):
+    with np.load(cache_file, allow_pickle=False) as data:
+        columns = data['__columns__'].tolist()
+        return pd.DataFrame({col: data[f"col_{i}"] for i, col in enumerate(columns)})
+
+
+def _prune_stale(path, cache_file, cache_dir):
+    """Remove caches for older versions of the same workbook"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    for name in os.listdir(cache_dir):
+        candidate = os.path.join(cache_dir, name)
+        if name.startswith(stem + '-') and name.endswith('.npz') and candidate != cache_file:
+            os.remove(candidate)
+
+
+def apply_appended_years(df, appended_path=APPENDED_YEARS_PATH):
+    """
+    Merge the appended-years CSV into df, if it exists.
+
+    The CSV is an append-only log: a row for a new year extends the data, a
+    row for an existing year replaces it, and the latest row for a year wins.
+    """
+    if not appended_path or not os.path.exists(appended_path):
+        return df
+    appended = pd.read_csv(appended_path).reindex(columns=df.columns)
+    if appended.empty:
+        return df
+    combined = pd.concat([df, appended.astype(df.dtypes.to_dict())], ignore_index=True)
+    combined = combined.drop_duplicates('Year Ended', keep='last')
+    return combined.sort_values('Year Ended', ignore_index=True)
+
+
+def _read_workbook(path, cache_dir, use_cache):
+    if not use_cache:
+        return pd.read_excel(path)
+
+    cache_file = _cache_path(path, workbook_hash(path), cache_dir)
+    if os.path.exists(cache_file):
+        try:
+            return _read_cache(cache_file)
+        except (OSError, ValueError, KeyError):
+            # Corrupt or truncated cache - fall through and rebuild it
+            pass
+
+    df = pd.read_excel(path)
+    _write_cache(df, cache_file)
+    _prune_stale(path, cache_file, cache_dir)
+    return df
+
+
+@traced('load_financial_data')
+def load_financial_data(path=WORKBOOK_PATH, cache_dir=CACHE_DIR, use_cache=True,
+                        appended_path=APPENDED_YEARS_PATH):
+    """
+    Load the 'Inputs' sheet of the workbook as a DataFrame, plus any
+    appended fiscal years.
+
+    The first load parses the spreadsheet and writes a columnar cache; later
+    loads read the cache directly until the workbook contents change.
+    """
+    return apply_appended_years(_read_workbook(path, cache_dir, use_cache), appended_path)
+
+
+if __name__ == "__main__":
+    data = load_financial_data()
+    print(f"✓ Loaded {len(data)} rows × {len(data.columns)} columns from {WORKBOOK_PATH}")
+    print(f"✓ Cache: {_cache_path(WORKBOOK_PATH, workbook_hash(), CACHE_DIR)}")
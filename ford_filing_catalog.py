@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Filing Catalog and Duplicate Detection
+Fingerprints each PDF by hashes of its page text, groups near-duplicate
+variants (e.g. the "(with TN highlights)" copies in 10k/) and marks one
+canonical copy per group so downstream PDF passes parse each filing once
+
+Fingerprints are persisted in a catalog keyed by the PDF's content hash, so
+only new or changed files are fingerprinted. Requires the optional pypdf
+package.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from ford_data_loader import CACHE_DIR, atomic_write_json, file_hash, read_json
+from ford_pdf_extract import fiscal_year_from_filename
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional: only needed to fingerprint new PDFs
+    PdfReader = None
+
+CATALOG_PATH = os.path.join(CACHE_DIR, 'filing_catalog.json')
+
+# Pages hashed per document; evenly spaced so variants that differ only in
+# annotations or highlights still line up page for page (None hashes all)
+SAMPLE_PAGES = 16
+
+# Minimum share of matching page hashes for two documents to be variants
+SIMILARITY_THRESHOLD = 0.75
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _page_numbers(num_pages, sample_pages):
+    if sample_pages is None or num_pages <= sample_pages:
+        return list(range(num_pages))
+    step = num_pages / sample_pages
+    return sorted({int(i * step) for i in range(sample_pages)})
+
+
+def fingerprint_document(path, sample_pages=SAMPLE_PAGES):
+    """Return {'pages': page count, 'hashes': {page number: text hash}}"""
+    if PdfReader is None:
+        raise ImportError("Fingerprinting filings requires pypdf: pip install pypdf")
+    reader = PdfReader(path)
+    num_pages = len(reader.pages)
+    hashes = {}
+    for number in _page_numbers(num_pages, sample_pages):
+        text = _WHITESPACE.sub(' ', reader.pages[number].extract_text() or '').strip()
+        hashes[str(number)] = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+    return {'pages': num_pages, 'hashes': hashes}
+
+
+def similarity(a, b):
+    """Share of sampled pages whose text hashes agree"""
+    if a['pages'] != b['pages']:
+        return 0.0
+    common = set(a['hashes']) & set(b['hashes'])
+    if not common:
+        return 0.0
+    return sum(a['hashes'][page] == b['hashes'][page] for page in common) / len(common)
+
+
+def _canonical_rank(path):
+    """Prefer the plain copy over annotated variants, then the smaller file"""
+    annotated = 'highlight' in os.path.basename(path).lower()
+    return (annotated, os.path.getsize(path), path)
+
+
+def _load(catalog_path):
+    return read_json(catalog_path, {'fingerprints': {}, 'filings': {}})
+
+
+def _save(catalog, catalog_path):
+    atomic_write_json(catalog_path, catalog, indent=2, sort_keys=True)
+
+
+def build_catalog(paths, catalog_path=CATALOG_PATH, workers=1,
+                  threshold=SIMILARITY_THRESHOLD):
+    """
+    Fingerprint paths (reusing stored fingerprints) and group variants.
+
+    Returns {path: {'hash', 'fiscal_year', 'group', 'canonical'}} where group
+    is the canonical path of the document's variant group.
+    """
+    paths = sorted(paths)
+    catalog = _load(catalog_path)
+    fingerprints = catalog['fingerprints']
+
+    hashes = {path: file_hash(path) for path in paths}
+    pending = sorted({hashes[path] for path in paths} - set(fingerprints))
+    pending_paths = [next(p for p in paths if hashes[p] == digest) for digest in pending]
+
+    if workers > 1 and len(pending_paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fingerprint_document, pending_paths))
+    else:
+        results = [fingerprint_document(path) for path in pending_paths]
+    fingerprints.update(zip(pending, results))
+
+    # Union-find over documents with the same fiscal year and matching pages
+    parent = {path: path for path in paths}
+
+    def find(path):
+        while parent[path] != path:
+            parent[path] = parent[parent[path]]
+            path = parent[path]
+        return path
+
+    for i, a in enumerate(paths):
+        for b in paths[i + 1:]:
+            if fiscal_year_from_filename(a) != fiscal_year_from_filename(b):
+                continue
+            if (hashes[a] == hashes[b]
+                    or similarity(fingerprints[hashes[a]], fingerprints[hashes[b]]) >= threshold):
+                parent[find(b)] = find(a)
+
+    members = {}
+    for path in paths:
+        members.setdefault(find(path), []).append(path)
+    canonical = {root: min(group, key=_canonical_rank) for root, group in members.items()}
+
+    filings = {}
+    for path in paths:
+        group = canonical[find(path)]
+        filings[path] = {'hash': hashes[path], 'fiscal_year': fiscal_year_from_filename(path),
+                         'group': group, 'canonical': path == group}
+
+    # Keep entries for other directories; forget files that no longer exist
+    catalog['filings'] = {path: entry for path, entry in catalog['filings'].items()
+                          if os.path.exists(path)}
+    catalog['filings'].update(filings)
+    live = {entry['hash'] for entry in catalog['filings'].values()}
+    catalog['fingerprints'] = {digest: fp for digest, fp in fingerprints.items() if digest in live}
+    _save(catalog, catalog_path)
+    return filings
+
+
+def canonical_filings(paths, **kwargs):
+    """Drop non-canonical variants from paths, keeping input order"""
+    filings = build_catalog(paths, **kwargs)
+    return [path for path in paths if filings[path]['canonical']]
+
+
+if __name__ == "__main__":
+    from ford_search_index import list_documents
+
+    parser = argparse.ArgumentParser(description="Catalog the filings and flag duplicate variants")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    filings = build_catalog(list_documents(canonical_only=False), workers=args.workers)
+    duplicates = [path for path, entry in filings.items() if not entry['canonical']]
+    for path, entry in filings.items():
+        marker = '✓' if entry['canonical'] else '↳ duplicate of ' + os.path.basename(entry['group'])
+        print(f"{entry['fiscal_year'] or '----'}  {os.path.basename(path)}  {marker}")
+    print(f"\n✓ {len(filings) - len(duplicates)} canonical filing(s), "
+          f"{len(duplicates)} duplicate variant(s) skipped downstream")
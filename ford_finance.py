@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Investment Valuation Helpers
+Vectorized present-value calculations shared by the analysis, chart and memo
+scripts
+"""
+
+import numpy as np
+
+
+def calculate_pv_annuity(payment, rate, years):
+    """
+    Calculate present value of an ordinary annuity.
+
+    Accepts scalars or arrays for any argument and broadcasts them with the
+    usual NumPy rules, so a whole rate grid is evaluated in one call. A rate
+    of exactly zero returns payment * years. Scalar inputs return a float.
+    """
+    payment = np.asarray(payment, dtype=np.float64)
+    rate = np.asarray(rate, dtype=np.float64)
+    years = np.asarray(years, dtype=np.float64)
+
+    zero_rate = rate == 0
+    safe_rate = np.where(zero_rate, 1.0, rate)
+    factor = (1 - (1 + safe_rate) ** (-years)) / safe_rate
+    factor = np.where(zero_rate, years, factor)
+
+    pv = payment * factor
+    return pv.item() if pv.ndim == 0 else pv
+
+
+def pv_grid(payments, rates, years):
+    """
+    Evaluate every payment × rate × term combination at once.
+
+    Returns an array of shape (len(payments), len(rates), len(years)).
+    """
+    payments = np.atleast_1d(np.asarray(payments, dtype=np.float64))
+    rates = np.atleast_1d(np.asarray(rates, dtype=np.float64))
+    years = np.atleast_1d(np.asarray(years, dtype=np.float64))
+    return calculate_pv_annuity(payments[:, None, None], rates[None, :, None],
+                                years[None, None, :])
+
+
+# Candidate rates scanned for sign changes before the root is polished;
+# roots outside this range are reported as NaN. Built from integer percent
+# steps so the zero rate is exactly 0.0, where calculate_pv_annuity has no
+# cancellation error.
+RATE_GRID = np.concatenate([np.arange(-50, 101) / 100, [1.5, 2.0, 3.0, 5.0, 10.0]])
+
+# The non-negative part of RATE_GRID: the only rates that are meaningful as
+# discount rates
+DISCOUNT_RATE_GRID = RATE_GRID[RATE_GRID >= 0]
+
+
+def pv_annuity_derivative(payment, rate, years):
+    """d PV / d rate of calculate_pv_annuity (broadcasts the same way)"""
+    payment = np.asarray(payment, dtype=np.float64)
+    rate = np.asarray(rate, dtype=np.float64)
+    years = np.asarray(years, dtype=np.float64)
+
+    zero_rate = rate == 0
+    safe_rate = np.where(zero_rate, 1.0, rate)
+    discount = (1 + safe_rate) ** (-years)
+    slope = years * discount / (safe_rate * (1 + safe_rate)) - (1 - discount) / safe_rate ** 2
+    slope = np.where(zero_rate, -years * (years + 1) / 2, slope)
+    return payment * slope
+
+
+def _first_bracket(values, grid):
+    """Index of the first grid interval whose endpoints straddle zero (-1 if none)"""
+    straddles = np.sign(values[:, :-1]) * np.sign(values[:, 1:]) <= 0
+    found = straddles.any(axis=1)
+    return np.where(found, straddles.argmax(axis=1), -1)
+
+
+def solve_rates(func, slope, shape, grid=RATE_GRID, tol=1e-10, max_iter=100):
+    """
+    Find the lowest rate in grid where func(rate) == 0, for a batch at once.
+
+    func and slope map a rate array of the given batch shape to values and
+    derivatives. Every problem is bracketed on grid, then refined with
+    Newton steps that fall back to bisection whenever a step leaves the
+    bracket, with all problems iterating together. Problems without a sign
+    change on grid return NaN. A scalar shape () returns a float.
+    """
+    size = int(np.prod(shape))
+    grid = np.asarray(grid, dtype=np.float64)
+    values = np.stack([np.broadcast_to(func(np.full(shape, r)), shape).ravel() for r in grid],
+                      axis=1)
+    # A root at exactly r = 0 must not be lost to rounding in func: snap
+    # residuals within tol there to zero so the bracket starts at 0
+    zero = grid == 0
+    values[:, zero] = np.where(np.abs(values[:, zero]) < tol, 0.0, values[:, zero])
+    start = _first_bracket(values, grid)
+    solvable = start >= 0
+
+    rows = np.arange(size)
+    lo = np.where(solvable, grid[np.maximum(start, 0)], np.nan)
+    hi = np.where(solvable, grid[np.maximum(start, 0) + 1], np.nan)
+    f_lo = values[rows, np.maximum(start, 0)]
+    rate = np.where(solvable, (lo + hi) / 2, np.nan)
+    active = solvable & (f_lo != 0)
+    rate[solvable & (f_lo == 0)] = lo[solvable & (f_lo == 0)]
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        f = np.broadcast_to(func(rate.reshape(shape)), shape).ravel()
+        df = np.broadcast_to(slope(rate.reshape(shape)), shape).ravel()
+
+        # Shrink the bracket around the root, then take a Newton step inside it
+        left = np.sign(f) == np.sign(f_lo)
+        lo = np.where(active & left, rate, lo)
+        f_lo = np.where(active & left, f, f_lo)
+        hi = np.where(active & ~left, rate, hi)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = rate - f / df
+        inside = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        step = np.where(inside, newton, (lo + hi) / 2)
+
+        converged = (np.abs(f) < tol) | (hi - lo < tol)
+        active &= ~converged
+        rate = np.where(active, step, rate)
+    rate = rate.reshape(shape)
+    return rate.item() if rate.ndim == 0 else rate
+
+
+def annuity_irr(payment, years, cost):
+    """
+    Rate at which the annuity's present value equals its up-front cost.
+
+    Arguments broadcast like calculate_pv_annuity. NaN means no rate on
+    RATE_GRID recovers the cost.
+    """
+    payment, years, cost = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64)
+                                                  for a in (payment, years, cost)))
+    return solve_rates(lambda r: calculate_pv_annuity(payment, r, years) - cost,
+                       lambda r: pv_annuity_derivative(payment, r, years),
+                       payment.shape)
+
+
+def crossover_rate(payment_a, years_a, payment_b, years_b, cost_a=0, cost_b=0):
+    """
+    Lowest non-negative discount rate at which the NPVs of two annuities are
+    equal.
+
+    NPV is present value minus up-front cost. Only DISCOUNT_RATE_GRID is
+    searched, so a crossing at a negative rate is ignored. NaN means neither
+    option overtakes the other at any rate from 0 up (one dominates).
+    """
+    args = np.broadcast_arrays(*(np.asarray(a, dtype=np.float64) for a in
+                                 (payment_a, years_a, payment_b, years_b, cost_a, cost_b)))
+    payment_a, years_a, payment_b, years_b, cost_a, cost_b = args
+
+    def npv_gap(r):
+        return ((calculate_pv_annuity(payment_a, r, years_a) - cost_a)
+                - (calculate_pv_annuity(payment_b, r, years_b) - cost_b))
+
+    def gap_slope(r):
+        return (pv_annuity_derivative(payment_a, r, years_a)
+                - pv_annuity_derivative(payment_b, r, years_b))
+
+    return solve_rates(npv_gap, gap_slope, payment_a.shape, grid=DISCOUNT_RATE_GRID)
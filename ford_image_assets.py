@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Web Image Assets
+Builds responsive AVIF, WebP and downscaled PNG variants of the images that
+index.html embeds, with content-hashed file names, and rewrites the page to
+serve them through <picture>/srcset with lazy loading
+
+Variants are only re-encoded when the source image or the encoding settings
+change. The page rewrite is idempotent: already-converted images are found
+by their data-source attribute and regenerated in place.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+
+from ford_data_loader import CACHE_DIR, atomic_write_json, file_hash, read_json
+
+try:
+    from PIL import Image
+except ImportError:  # optional: only needed to encode new variants
+    Image = None
+
+PAGE_PATH = 'index.html'
+ASSET_DIR = 'assets'
+MANIFEST_PATH = os.path.join(CACHE_DIR, 'asset_manifest.json')
+
+# Encoder settings per output format (part of each variant's cache key)
+FORMATS = {
+    'avif': {'quality': 55},
+    'webp': {'quality': 82, 'method': 6},
+    'png': {'optimize': True},
+}
+MIME_TYPES = {'avif': 'image/avif', 'webp': 'image/webp', 'png': 'image/png'}
+
+# widths: srcset candidates in pixels; display: CSS width the layout shows
+# the image at (used to pick the fallback src and for the weight report)
+Profile = namedtuple('Profile', ['widths', 'sizes', 'display', 'lazy'])
+
+CHART_PROFILE = Profile([480, 960, 1600, 2240], '(max-width: 1200px) calc(100vw - 80px), 1120px',
+                        1120, True)
+PROFILES = {
+    # The logo sits in the header above the fold, so it is never lazy-loaded
+    'Ford_Motor_Company_Logo.png': Profile([200, 400], '200px', 200, False),
+}
+
+# Mobile viewport used for the weight report
+MOBILE_WIDTH = 400
+MOBILE_DPR = 2
+
+_IMG_TAG = re.compile(r'<img\s+([^>]*?)\s*/?>')
+_PICTURE = re.compile(r'<picture data-source="([^"]+)">.*?</picture>', re.DOTALL)
+_ATTRIBUTE = re.compile(r'([\w-]+)="([^"]*)"')
+
+
+def profile_for(source):
+    return PROFILES.get(os.path.basename(source), CHART_PROFILE)
+
+
+def _settings_key(widths):
+    return hashlib.sha256(json.dumps([FORMATS, widths], sort_keys=True).encode()).hexdigest()[:16]
+
+
+def encode_variants(source, widths, asset_dir=ASSET_DIR):
+    """
+    Write every format × width variant of source into asset_dir.
+
+    Widths wider than the source are dropped (the source width is used once
+    instead). Returns [{'format', 'width', 'height', 'file', 'bytes'}, ...].
+    """
+    if Image is None:
+        raise ImportError("Building image assets requires Pillow: pip install pillow")
+    os.makedirs(asset_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(source))[0]
+
+    with Image.open(source) as original:
+        image = original.convert('RGBA')
+    # Drop a fully opaque alpha channel: smaller files in every format
+    if image.getextrema()[3] == (255, 255):
+        image = image.convert('RGB')
+
+    usable = sorted({min(width, image.width) for width in widths})
+    variants = []
+    for width in usable:
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt, options in FORMATS.items():
+            tmp_path = os.path.join(asset_dir, f'.{stem}.{width}w.{fmt}.tmp')
+            resized.save(tmp_path, format=fmt.upper(), **options)
+            digest = file_hash(tmp_path)[:10]
+            path = os.path.join(asset_dir, f'{stem}.{width}w.{digest}.{fmt}')
+            os.replace(tmp_path, path)
+            variants.append({'format': fmt, 'width': width, 'height': height,
+                             'file': path, 'bytes': os.path.getsize(path)})
+    return variants
+
+
+def _load_manifest(path):
+    return read_json(path, {})
+
+
+def _save_manifest(manifest, path):
+    atomic_write_json(path, manifest, indent=2, sort_keys=True)
+
+
+def build_assets(sources, asset_dir=ASSET_DIR, manifest_path=MANIFEST_PATH, force=False):
+    """
+    Bring the variants of every source up to date.
+
+    Returns ({source: variants}, [re-encoded sources]). Image files in
+    asset_dir that no current variant references are deleted; other files
+    (such as the chart dataset) are left alone.
+    """
+    manifest = _load_manifest(manifest_path)
+    assets = {}
+    encoded = []
+    for source in sources:
+        widths = profile_for(source).widths
+        key = {'source_hash': file_hash(source), 'settings': _settings_key(widths)}
+        entry = manifest.get(source)
+        fresh = (entry and not force and all(entry[k] == v for k, v in key.items())
+                 and all(os.path.exists(v['file']) for v in entry['variants']))
+        if not fresh:
+            entry = dict(key, variants=encode_variants(source, widths, asset_dir))
+            encoded.append(source)
+        manifest[source] = entry
+        assets[source] = entry['variants']
+
+    manifest = {source: manifest[source] for source in sources}
+    live = {os.path.basename(v['file']) for variants in assets.values() for v in variants}
+    for name in os.listdir(asset_dir) if os.path.isdir(asset_dir) else []:
+        if name not in live and os.path.splitext(name)[1].lstrip('.') in FORMATS:
+            os.remove(os.path.join(asset_dir, name))
+    _save_manifest(manifest, manifest_path)
+    return assets, encoded
+
+
+def pick_variant(variants, fmt, pixels):
+    """Smallest variant of fmt at least pixels wide (else the widest)"""
+    candidates = sorted((v for v in variants if v['format'] == fmt), key=lambda v: v['width'])
+    return next((v for v in candidates if v['width'] >= pixels), candidates[-1])
+
+
+def _url(path):
+    return path.replace(os.sep, '/').replace(' ', '%20')
+
+
+def _srcset(variants, fmt):
+    return ', '.join(f"{_url(v['file'])} {v['width']}w"
+                     for v in sorted(variants, key=lambda v: v['width']) if v['format'] == fmt)
+
+
+def picture_html(source, variants, attributes, indent=''):
+    """<picture> markup for source; attributes are the original <img> attributes"""
+    profile = profile_for(source)
+    fallback = pick_variant(variants, 'png', profile.display)
+    display_height = round(fallback['height'] * profile.display / fallback['width'])
+
+    img_attributes = {key: value for key, value in attributes.items()
+                      if key not in ('src', 'srcset', 'sizes', 'width', 'height',
+                                     'loading', 'decoding')}
+    img_attributes = dict(src=_url(fallback['file']), srcset=_srcset(variants, 'png'),
+                          sizes=profile.sizes, width=str(profile.display),
+                          height=str(display_height), **img_attributes,
+                          loading='lazy' if profile.lazy else 'eager', decoding='async')
+
+    lines = [f'<picture data-source="{source}">']
+    for fmt in ('avif', 'webp'):
+        lines.append(f'    <source type="{MIME_TYPES[fmt]}" srcset="{_srcset(variants, fmt)}" '
+                     f'sizes="{profile.sizes}">')
+    lines.append('    <img ' + ' '.join(f'{k}="{v}"' for k, v in img_attributes.items()) + '>')
+    lines.append('</picture>')
+    return ('\n' + indent).join(lines)
+
+
+def page_images(html):
+    """Local image sources referenced by the page, in order of appearance"""
+    sources = []
+    for match in _PICTURE.finditer(html):
+        sources.append((match.start(), match.group(1)))
+    for match in _IMG_TAG.finditer(_PICTURE.sub('', html)):
+        src = dict(_ATTRIBUTE.findall(match.group(1))).get('src', '')
+        if src and '://' not in src and os.path.exists(src):
+            sources.append((match.start(), src))
+    return list(dict.fromkeys(src for _, src in sorted(sources)))
+
+
+def rewrite_page(html, assets):
+    """Replace each <img> (or earlier <picture>) of an asset source with fresh markup"""
+
+    def indent_at(position):
+        line_start = html.rfind('\n', 0, position) + 1
+        return html[line_start:position] if not html[line_start:position].strip() else ''
+
+    def replace_picture(match):
+        source = match.group(1)
+        if source not in assets:
+            return match.group(0)
+        img = _IMG_TAG.search(match.group(0))
+        attributes = dict(_ATTRIBUTE.findall(img.group(1)))
+        return picture_html(source, assets[source], attributes, indent_at(match.start()))
+
+    def replace_img(match):
+        attributes = dict(_ATTRIBUTE.findall(match.group(1)))
+        source = attributes.get('src')
+        if source not in assets:
+            return match.group(0)
+        return picture_html(source, assets[source], attributes, indent_at(match.start()))
+
+    html = _PICTURE.sub(replace_picture, html)
+    # Only bare <img> tags outside <picture> elements are converted
+    pieces = []
+    last = 0
+    for match in _PICTURE.finditer(html):
+        pieces.append(_IMG_TAG.sub(replace_img, html[last:match.start()]))
+        pieces.append(match.group(0))
+        last = match.end()
+    pieces.append(_IMG_TAG.sub(replace_img, html[last:]))
+    return ''.join(pieces)
+
+
+def weight_report(assets, html_before, html_after):
+    """
+    Rows of bytes per image: original PNG, and the AVIF/WebP/PNG variants a
+    desktop (display width, 1x) and a mobile (2x) browser would download.
+    """
+    rows = []
+    for source, variants in assets.items():
+        profile = profile_for(source)
+        mobile = min(profile.display, MOBILE_WIDTH) * MOBILE_DPR
+        rows.append({'image': source, 'original': os.path.getsize(source),
+                     'avif_desktop': pick_variant(variants, 'avif', profile.display)['bytes'],
+                     'avif_mobile': pick_variant(variants, 'avif', mobile)['bytes'],
+                     'webp_desktop': pick_variant(variants, 'webp', profile.display)['bytes'],
+                     'png_desktop': pick_variant(variants, 'png', profile.display)['bytes']})
+    rows.append({'image': PAGE_PATH, 'original': len(html_before.encode('utf-8')),
+                 **{key: len(html_after.encode('utf-8'))
+                    for key in ('avif_desktop', 'avif_mobile', 'webp_desktop', 'png_desktop')}})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build responsive image variants for index.html")
+    parser.add_argument('--page', default=PAGE_PATH)
+    parser.add_argument('--force', action='store_true', help="re-encode every variant")
+    args = parser.parse_args()
+
+    with open(args.page, encoding='utf-8') as f:
+        html = f.read()
+    sources = page_images(html)
+    assets, encoded = build_assets(sources, force=args.force)
+    new_html = rewrite_page(html, assets)
+    if new_html != html:
+        with open(args.page, 'w', encoding='utf-8') as f:
+            f.write(new_html)
+
+    print(f"✓ {len(sources)} image(s), {len(encoded)} re-encoded → {ASSET_DIR}/")
+    rows = weight_report(assets, html, new_html)
+    columns = ['original', 'avif_desktop', 'avif_mobile', 'webp_desktop', 'png_desktop']
+    print(f"\n{'file':<36}" + ''.join(f"{name:>14}" for name in columns))
+    for row in rows:
+        print(f"{row['image']:<36}" + ''.join(f"{row[name] / 1024:>11.1f} KB" for name in columns))
+    totals = {name: sum(row[name] for row in rows) for name in columns}
+    print(f"{'total':<36}" + ''.join(f"{totals[name] / 1024:>11.1f} KB" for name in columns))
+    for name in columns[1:]:
+        print(f"✓ Page weight ({name.replace('_', ', ')}): "
+              f"{100 * (1 - totals[name] / totals['original']):.1f}% smaller")
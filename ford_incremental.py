@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Incremental Fiscal-Year Updates
+Adds a newly filed fiscal year (or corrects an existing one) without
+touching the workbook, keeps running aggregates of every column up to date
+in O(columns) per appended year, and re-runs only the pipeline steps whose
+input columns actually changed
+
+Rows go to the append-only APPENDED_YEARS_PATH CSV that the loader merges
+in. The aggregates (count, sum, mean, min, max and their years, first/last,
+positive/negative counts) are persisted in .ford_cache, and the outline
+summary, summary CSV and memo Table 6 read their figures from them instead of
+rescanning the data.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+
+import pandas as pd
+
+from ford_data_loader import (APPENDED_YEARS_PATH, CACHE_DIR, WORKBOOK_PATH, atomic_write_json,
+                              file_hash, load_financial_data, read_json)
+from ford_metrics import MEMO_RATIOS, RATIO_REGISTRY, compute_ratios
+from ford_panel import (OUTLINE_AGGREGATES, OUTLINE_COLUMNS, OUTLINE_COUNTS,
+                        OUTLINE_EXTREME_YEARS, YEAR)
+
+AGGREGATES_PATH = os.path.join(CACHE_DIR, 'running_aggregates.json')
+
+# Bump when the saved statistics change so old files are rebuilt, not misread
+AGGREGATES_VERSION = 1
+
+# groupby aggregation / idx function -> running statistic
+_STATISTICS = {'first': 'first', 'last': 'last', 'count': 'count', 'min': 'min', 'max': 'max',
+               'sum': 'sum', 'idxmin': 'min_year', 'idxmax': 'max_year'}
+
+
+def _empty_stats():
+    return {'count': 0, 'sum': 0.0, 'compensation': 0.0, 'min': None, 'max': None, 'min_year': None,
+            'max_year': None, 'first': None, 'first_year': None, 'last': None,
+            'last_year': None, 'positive': 0, 'negative': 0}
+
+
+class RunningAggregates:
+    """
+    Per-column running statistics over fiscal years, updated one year at a
+    time. Years must arrive in order; NaN values are skipped, as pandas does.
+    """
+
+    def __init__(self, columns=None, source=None):
+        self.columns = columns or {}
+        self.source = source
+
+    @classmethod
+    def from_frame(cls, df, source=None):
+        aggregates = cls(source=source)
+        for row in df.to_dict('records'):
+            aggregates.append(row)
+        return aggregates
+
+    def append(self, row):
+        """Fold one fiscal year's {column: value} into the statistics"""
+        year = int(row[YEAR])
+        for column, value in row.items():
+            if value is None or (isinstance(value, float) and math.isnan(value)):
+                continue
+            value = float(value)
+            stats = self.columns.setdefault(column, _empty_stats())
+            stats['count'] += 1
+            # Neumaier summation: the low-order bits lost by each addition are
+            # carried separately, so the total matches an exact sum of the years
+            total = stats['sum'] + value
+            if abs(stats['sum']) >= abs(value):
+                stats['compensation'] += (stats['sum'] - total) + value
+            else:
+                stats['compensation'] += (value - total) + stats['sum']
+            stats['sum'] = total
+            # Strict comparisons keep the first year of a tie, like idxmin/idxmax
+            if stats['min'] is None or value < stats['min']:
+                stats['min'], stats['min_year'] = value, year
+            if stats['max'] is None or value > stats['max']:
+                stats['max'], stats['max_year'] = value, year
+            if stats['first'] is None:
+                stats['first'], stats['first_year'] = value, year
+            stats['last'], stats['last_year'] = value, year
+            stats['positive'] += value > 0
+            stats['negative'] += value < 0
+        return self
+
+    def stat(self, column, name):
+        stats = self.columns[column]
+        if name == 'sum':
+            return stats['sum'] + stats['compensation']
+        if name == 'mean':
+            return self.stat(column, 'sum') / stats['count'] if stats['count'] else math.nan
+        return stats[name]
+
+    def outline_row(self):
+        """The figures of ford_panel.outline_summary for this single issuer"""
+        row = {name: self.stat(column, _STATISTICS.get(how, how))
+               for name, (column, how) in OUTLINE_AGGREGATES.items()}
+        row.update({name: self.stat(column, 'positive' if sign > 0 else 'negative')
+                    for name, (column, sign) in OUTLINE_COUNTS.items()})
+        row.update({name: self.stat(column, _STATISTICS[how])
+                    for name, (column, how) in OUTLINE_EXTREME_YEARS.items()})
+        return row
+
+    def save(self, path=AGGREGATES_PATH):
+        atomic_write_json(path, {'version': AGGREGATES_VERSION, 'source': self.source,
+                                 'columns': self.columns}, indent=2)
+
+    @classmethod
+    def load(cls, path=AGGREGATES_PATH):
+        data = read_json(path)
+        if not isinstance(data, dict) or data.get('version') != AGGREGATES_VERSION:
+            return None
+        return cls(data['columns'], data.get('source'))
+
+
+def data_source(workbook_path=WORKBOOK_PATH, appended_path=APPENDED_YEARS_PATH):
+    """
+    What the aggregates were built from: the workbook and appended-years CSV
+    hashes and the ratios aggregated alongside the inputs
+    """
+    appended = file_hash(appended_path) if os.path.exists(appended_path) else None
+    return {'workbook': file_hash(workbook_path), 'appended': appended,
+            'ratios': list(MEMO_RATIOS)}
+
+
+def with_ratios(df, names=MEMO_RATIOS):
+    ratios = compute_ratios(df, names)
+    return df.assign(**{name: ratios[name] for name in ratios.columns})
+
+
+def current_aggregates(df=None, path=AGGREGATES_PATH, workbook_path=WORKBOOK_PATH,
+                       appended_path=APPENDED_YEARS_PATH):
+    """
+    Saved aggregates if they match the workbook and appended-years files df
+    was loaded from, else rebuilt from df (loaded from those files if None)
+    """
+    source = data_source(workbook_path, appended_path)
+    aggregates = RunningAggregates.load(path)
+    if aggregates is None or aggregates.source != source:
+        if df is None:
+            df = load_financial_data(workbook_path, appended_path=appended_path)
+        aggregates = RunningAggregates.from_frame(with_ratios(df), source)
+        aggregates.save(path)
+    return aggregates
+
+
+def affected_columns(changed):
+    """changed input columns plus every registry ratio computed from them"""
+    changed = set(changed)
+    return changed | {name for name, ratio in RATIO_REGISTRY.items()
+                      if changed & set(ratio.inputs)}
+
+
+def step_columns():
+    """{pipeline step: data columns it reads} for every data-driven step"""
+    import ford_analysis_per_outline as outline
+    import ford_web_data as web
+    from ford_separate_visualizations import CHART_TARGETS, chart_name
+    from generate_memo_tables import MEMO_TABLES, SUMMARY_METRICS
+
+    memo = [col.key for name in ('revenue', 'cash_flow', 'balance_sheet', 'liquidity')
+            for col in MEMO_TABLES[name].columns] + [source for _, source in SUMMARY_METRICS]
+    columns = {
+        'summary': OUTLINE_COLUMNS,
+        'memo_tables': memo,
+        'summary_csv': outline.SUMMARY_COLUMNS,
+        'dashboard': outline.DASHBOARD_COLUMNS,
+        'web_data': web.DATASET_COLUMNS,
+    }
+    for path, (_, chart_columns, _) in CHART_TARGETS.items():
+        columns[chart_name(path)] = chart_columns
+    return columns
+
+
+def stale_steps(changed):
+    """Pipeline steps reading any column affected by the changed input columns"""
+    affected = affected_columns(changed)
+    return [step for step, columns in step_columns().items() if affected & set(columns)]
+
+
+def _differs(new, old):
+    """True when a value changed; NaN compared with NaN counts as unchanged"""
+    if pd.isna(new) and pd.isna(old):
+        return False
+    return new != old
+
+
+def _append_row(row, columns, appended_path):
+    new_file = not os.path.exists(appended_path)
+    with open(appended_path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        if new_file:
+            writer.writerow(columns)
+        # Ten significant digits drops float repr noise such as 19.580000000000002
+        writer.writerow([f'{row[col]:.10g}' if isinstance(row[col], float) else row[col]
+                         for col in columns])
+
+
+def append_fiscal_year(values, appended_path=APPENDED_YEARS_PATH, aggregates_path=AGGREGATES_PATH,
+                       workbook_path=WORKBOOK_PATH):
+    """
+    Add or correct one fiscal year.
+
+    values maps 'Year Ended' and input columns to numbers. A year after the
+    last one must give every input column and is folded into the running
+    aggregates in O(columns). A correction to an existing year may give just
+    the changed columns; since a past minimum or maximum cannot be un-applied,
+    its aggregates are rebuilt from the data.
+
+    Returns (changed input columns, pipeline steps to re-run, aggregates).
+    """
+    df = load_financial_data(workbook_path, appended_path=appended_path)
+    aggregates = current_aggregates(df, aggregates_path, workbook_path, appended_path)
+    year = int(values[YEAR])
+    columns = list(df.columns)
+    unknown = set(values) - set(columns)
+    if unknown:
+        raise KeyError(f"Unknown column(s): {sorted(unknown)}")
+
+    existing = df.index[df[YEAR] == year]
+    if len(existing):
+        old = df.loc[existing[0]].to_dict()
+        row = {**old, **values, YEAR: year}
+        changed = [col for col in columns if col != YEAR and _differs(row[col], old[col])]
+    elif year > int(df[YEAR].max()):
+        missing = [col for col in columns if col not in values]
+        if missing:
+            raise ValueError(f"FY{year} is missing column(s): {missing}")
+        row = {**values, YEAR: year}
+        changed = columns
+    else:
+        raise ValueError(f"FY{year} is before the last fiscal year ({int(df[YEAR].max())}) "
+                         "and not in the data")
+
+    if not changed:
+        return [], [], aggregates
+    _append_row(row, columns, appended_path)
+    source = data_source(workbook_path, appended_path)
+    if len(existing):
+        updated = load_financial_data(workbook_path, appended_path=appended_path)
+        aggregates = RunningAggregates.from_frame(with_ratios(updated), source)
+    else:
+        aggregates.append(with_ratios(pd.DataFrame([row], columns=columns)).iloc[0].to_dict())
+        aggregates.source = source
+    aggregates.save(aggregates_path)
+    return changed, stale_steps(changed), aggregates
+
+
+def _parse_values(args):
+    values = {}
+    if args.values:
+        with open(args.values) as f:
+            values.update(json.load(f))
+    for item in args.set or []:
+        column, _, value = item.partition('=')
+        values[column.strip()] = float(value)
+    values[YEAR] = args.year
+    return values
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Append or correct a fiscal year incrementally")
+    parser.add_argument('year', type=int, nargs='?', help="fiscal year to add or correct")
+    parser.add_argument('--values', help="JSON file of {column: value}")
+    parser.add_argument('--set', action='append', metavar='COLUMN=VALUE',
+                        help="one column value, e.g. 'Capex ($B)=8.9' (repeatable)")
+    parser.add_argument('--no-run', action='store_true',
+                        help="update the data and aggregates but do not re-run stale steps")
+    args = parser.parse_args()
+
+    if args.year is None:
+        row = current_aggregates().outline_row()
+        print(f"✓ {row['Years']:.0f} fiscal years ({row['First Year']:.0f}-{row['Last Year']:.0f}): "
+              f"FCF total ${row['FCF Total ($B)']:.1f}B, revenue ${row['Revenue Min ($B)']:.0f}B-"
+              f"${row['Revenue Max ($B)']:.0f}B, {row['Positive FCF Years']:.0f} positive-FCF years")
+        raise SystemExit(0)
+
+    changed, steps, aggregates = append_fiscal_year(_parse_values(args))
+    if not changed:
+        print(f"✓ FY{args.year} unchanged; nothing to rebuild")
+        raise SystemExit(0)
+    row = aggregates.outline_row()
+    print(f"✓ FY{args.year} written to {APPENDED_YEARS_PATH} ({len(changed)} column(s) changed)")
+    print(f"✓ Aggregates: {row['Years']:.0f} years, FCF total ${row['FCF Total ($B)']:.1f}B, "
+          f"revenue ${row['Revenue Min ($B)']:.0f}B-${row['Revenue Max ($B)']:.0f}B")
+    print(f"✓ Stale steps: {', '.join(steps) or '(none)'}")
+
+    if steps and not args.no_run:
+        from ford_pipeline import pipeline_tasks, run_pipeline, select_steps
+        tasks = pipeline_tasks()
+        results = run_pipeline(tasks, select_steps(tasks, only=steps))
+        for name, (result, output, seconds) in results.items():
+            print(f"  {name:<12} {seconds:6.2f}s")
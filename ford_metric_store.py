@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Memory-Mapped Metric Store
+Persists the workbook inputs plus derived ratios as one column-major float64
+.npy file that worker processes memory-map read-only, so N workers share a
+single physical copy of the data instead of each receiving a pickled
+DataFrame or re-deriving the ratios
+
+A store is keyed by a hash of the frame it was written from and the ratios
+added, so an unchanged workbook reuses the existing file. Integer and text
+columns (fiscal years, tickers) are restored from a small JSON sidecar on
+attach.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from ford_data_loader import CACHE_DIR, atomic_write_json, load_financial_data
+from ford_metrics import MEMO_RATIOS, add_ratios
+
+STORE_PREFIX = 'metric_store'
+
+# Bump when the store layout changes so old files are never misread
+STORE_VERSION = 1
+
+
+class MetricStore(namedtuple('MetricStore', ['path'])):
+    """Picklable handle to a store; pass it to workers instead of the DataFrame"""
+
+    def attach(self):
+        return attach_metric_store(self.path)
+
+
+def frame_hash(df):
+    """SHA-256 of a frame's column names and values"""
+    digest = hashlib.sha256()
+    for col in df.columns:
+        digest.update(str(col).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(df[col], index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def store_path(df, ratios=MEMO_RATIOS, cache_dir=CACHE_DIR, name=STORE_PREFIX):
+    """Store file for df with ratios added: keyed by the data and the ratio names"""
+    key = hashlib.sha256((frame_hash(df) + json.dumps(list(ratios))).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f"{name}-v{STORE_VERSION}-{key[:16]}.npy")
+
+
+def _meta_path(path):
+    return os.path.splitext(path)[0] + '.json'
+
+
+def write_metric_store(df, path):
+    """
+    Write df's numeric columns as one Fortran-ordered float64 array (each
+    column contiguous on disk) plus a JSON sidecar with the column layout.
+    The sidecar is written last, so its presence marks a complete store.
+    """
+    numeric = [col for col in df.columns if df[col].dtype.kind in 'iuf']
+    text = [col for col in df.columns if col not in numeric]
+    meta = {
+        'columns': [str(col) for col in df.columns],
+        'numeric': numeric,
+        'integer': [col for col in numeric if df[col].dtype.kind in 'iu'],
+        'text': {col: df[col].astype(str).tolist() for col in text},
+    }
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    values = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float64,
+                                       shape=(len(df), len(numeric)), fortran_order=True)
+    for j, col in enumerate(numeric):
+        values[:, j] = df[col].to_numpy(dtype=np.float64)
+    values.flush()
+    del values
+    os.replace(tmp_path, path)
+
+    atomic_write_json(_meta_path(path), meta)
+
+
+def attach_metric_store(path):
+    """
+    A DataFrame over the store's memory map. Float columns are read-only
+    views of the shared pages (pandas copies on write); only integer and
+    text columns are materialised.
+    """
+    with open(_meta_path(path)) as f:
+        meta = json.load(f)
+    values = np.load(path, mmap_mode='r')
+    df = pd.DataFrame(values, columns=meta['numeric'], copy=False)
+    for col in meta['integer']:
+        df[col] = values[:, meta['numeric'].index(col)].astype(np.int64)
+    for col, items in meta['text'].items():
+        df[col] = items
+    return df[meta['columns']]
+
+
+def _prune_stale(path, cache_dir, name):
+    """Remove older stores of the same name; attached workers keep their mapping"""
+    keep = {os.path.basename(path), os.path.basename(_meta_path(path))}
+    pattern = re.compile(rf"{re.escape(name)}-v\d+-[0-9a-f]{{16}}\.(npy|json)(\.\w+)?(\.tmp)?$")
+    for candidate in os.listdir(cache_dir):
+        if pattern.match(candidate) and candidate not in keep:
+            os.remove(os.path.join(cache_dir, candidate))
+
+
+def ensure_metric_store(df, ratios=MEMO_RATIOS, cache_dir=CACHE_DIR, name=STORE_PREFIX):
+    """
+    Handle to the store for df with ratios added, writing it only if no
+    complete store for the same data exists yet. Stores of other names (e.g.
+    one per panel file) are kept side by side.
+    """
+    path = store_path(df, ratios, cache_dir, name)
+    if not (os.path.exists(path) and os.path.exists(_meta_path(path))):
+        write_metric_store(add_ratios(df.copy(), ratios), path)
+        _prune_stale(path, cache_dir, name)
+    return MetricStore(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the memory-mapped metric store")
+    parser.add_argument('--input', help="panel file (.csv, .xlsx or .npz) instead of the workbook")
+    args = parser.parse_args()
+
+    if args.input:
+        from ford_panel import load_panel
+        data = load_panel(args.input)
+        name = f"{STORE_PREFIX}-{os.path.splitext(os.path.basename(args.input))[0]}"
+    else:
+        data = load_financial_data()
+        name = STORE_PREFIX
+    store = ensure_metric_store(data, name=name)
+
+    start = time.perf_counter()
+    attached = store.attach()
+    elapsed = time.perf_counter() - start
+    print(f"✓ Store: {store.path} ({os.path.getsize(store.path) / 1024:.1f} KB, "
+          f"{len(attached):,} rows × {len(attached.columns)} columns)")
+    print(f"✓ Attached in {elapsed * 1000:.1f} ms")
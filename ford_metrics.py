@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Derived Ratio Engine
+Each metric is declared once with its input columns; the engine computes only
+the requested subset in a single vectorized NumPy pass
+"""
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+Ratio = namedtuple('Ratio', ['inputs', 'formula'])
+
+RATIO_REGISTRY = {
+    'Operating Margin %': Ratio(('Operating Income ($B)', 'Revenue ($B)'),
+                                lambda oi, rev: (oi / rev) * 100),
+    'Net Margin %': Ratio(('Net Income ($B)', 'Revenue ($B)'),
+                          lambda ni, rev: (ni / rev) * 100),
+    'Gross Margin %': Ratio(('Revenue ($B)', 'COGS ($B)'),
+                            lambda rev, cogs: ((rev - cogs) / rev) * 100),
+    'Free Cash Flow ($B)': Ratio(('Cash Flow from Ops ($B)', 'Capex ($B)'),
+                                 lambda cfo, capex: cfo - capex),
+    'Current Ratio': Ratio(('Current Assets ($B)', 'Current Liabilities ($B)'),
+                           lambda ca, cl: ca / cl),
+    'Debt to Equity': Ratio(('Total Debt ($B)', 'Shareholders Equity ($B)'),
+                            lambda debt, equity: debt / equity),
+    'ROE %': Ratio(('Net Income ($B)', 'Shareholders Equity ($B)'),
+                   lambda ni, equity: (ni / equity) * 100),
+    'ROA %': Ratio(('Net Income ($B)', 'Total Assets ($B)'),
+                   lambda ni, assets: (ni / assets) * 100),
+    'Interest Coverage': Ratio(('EBIT ($B)', 'Interest Expense ($B)'),
+                               lambda ebit, interest: ebit / interest),
+}
+
+# The five metrics every outline script and chart relies on
+OUTLINE_RATIOS = ['Operating Margin %', 'Net Margin %', 'Free Cash Flow ($B)',
+                  'Current Ratio', 'Debt to Equity']
+
+# Outline metrics plus the extras used by the memo tables
+MEMO_RATIOS = OUTLINE_RATIOS + ['Gross Margin %', 'ROE %', 'ROA %', 'Interest Coverage']
+
+
+def register_ratio(name, inputs, formula):
+    """Declare a new derived metric computed from raw input columns"""
+    RATIO_REGISTRY[name] = Ratio(tuple(inputs), formula)
+
+
+def compute_ratios(df, names=None):
+    """
+    Compute the requested ratios (all registered ratios by default).
+
+    Only the input columns the requested ratios need are pulled out of the
+    DataFrame, and each is converted to a float64 array exactly once.
+    """
+    names = list(RATIO_REGISTRY) if names is None else list(names)
+    unknown = [name for name in names if name not in RATIO_REGISTRY]
+    if unknown:
+        raise KeyError(f"Unknown ratio(s): {unknown}")
+
+    ratios = [RATIO_REGISTRY[name] for name in names]
+    needed = dict.fromkeys(col for ratio in ratios for col in ratio.inputs)
+    arrays = {col: df[col].to_numpy(dtype=np.float64) for col in needed}
+
+    # Match pandas semantics: division by zero yields inf/NaN without warnings
+    with np.errstate(divide='ignore', invalid='ignore'):
+        results = {name: ratio.formula(*(arrays[col] for col in ratio.inputs))
+                   for name, ratio in zip(names, ratios)}
+
+    return pd.DataFrame(results, index=df.index)
+
+
+def add_ratios(df, names=None):
+    """Compute the requested ratios and attach them to df in place"""
+    ratios = compute_ratios(df, names)
+    for name in ratios.columns:
+        df[name] = ratios[name]
+    return df
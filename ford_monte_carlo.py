@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Monte Carlo NPV Simulation
+Compares Investment A ($50M × 20 years) with Investment B ($40M × 12 years)
+under uncertain discount rates, cash-flow haircuts and early termination
+
+Paths are evaluated with NumPy in fixed-size chunks, each with its own child
+seed, and every chunk is reduced to fixed-width histograms and counts before
+the next one starts, so memory stays constant however many paths are run and
+results are identical with or without a process pool.
+"""
+
+import argparse
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ford_finance import calculate_pv_annuity
+from ford_trace import traced
+
+Investment = namedtuple('Investment', ['payment', 'years'])
+
+INVESTMENTS = {
+    'A': Investment(50, 20),
+    'B': Investment(40, 12),
+}
+
+DEFAULT_SEED = 5330
+DEFAULT_PATHS = 1_000_000
+CHUNK_SIZE = 250_000
+
+# Sampling assumptions. The discount rate is shared by both investments on a
+# path; haircuts and termination are drawn independently per investment.
+DEFAULT_PARAMS = {
+    'rate_mean': 0.09,           # normal, clipped to [rate_min, rate_max]
+    'rate_sd': 0.025,
+    'rate_min': 0.01,
+    'rate_max': 0.25,
+    'haircut_low': 0.0,          # triangular share of each payment lost
+    'haircut_mode': 0.05,
+    'haircut_high': 0.30,
+    'termination_hazard': 0.03,  # annual probability the contract ends early
+}
+
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# Discount-rate bands for the conditional superiority table
+RATE_BANDS = [0.0, 0.06, 0.08, 0.10, 0.12, 1.0]
+
+# Histogram resolution for percentiles ($M per bin)
+BIN_WIDTH = 0.01
+
+_NPV_SERIES = ['A', 'B', 'Advantage A']
+
+
+def _histogram_range(name):
+    """NPV bounds for a series: no path can exceed undiscounted, un-haircut cash"""
+    if name == 'Advantage A':
+        a, b = INVESTMENTS['A'], INVESTMENTS['B']
+        return -b.payment * b.years, a.payment * a.years
+    investment = INVESTMENTS[name]
+    return 0.0, investment.payment * investment.years
+
+
+def _bin_counts(values, name):
+    lo, hi = _histogram_range(name)
+    num_bins = int(round((hi - lo) / BIN_WIDTH)) + 1
+    index = np.clip(((values - lo) / BIN_WIDTH).astype(np.int64), 0, num_bins - 1)
+    return np.bincount(index, minlength=num_bins)
+
+
+def sample_npvs(rng, n, params=None):
+    """
+    Draw n paths and return (rates, {'A': npv, 'B': npv}) in $M.
+
+    A contract terminated in year t pays only the t - 1 payments before it.
+    """
+    params = {**DEFAULT_PARAMS, **(params or {})}
+    rates = np.clip(rng.normal(params['rate_mean'], params['rate_sd'], n),
+                    params['rate_min'], params['rate_max'])
+
+    npvs = {}
+    for name, investment in INVESTMENTS.items():
+        haircut = rng.triangular(params['haircut_low'], params['haircut_mode'],
+                                 params['haircut_high'], n)
+        terminated = rng.geometric(params['termination_hazard'], n) - 1
+        years = np.minimum(investment.years, terminated)
+        npvs[name] = calculate_pv_annuity(investment.payment * (1 - haircut), rates, years)
+    return rates, npvs
+
+
+def simulate_chunk(seed, n, params=None):
+    """Simulate n paths and reduce them to histograms and superiority counts"""
+    rates, npvs = sample_npvs(np.random.default_rng(seed), n, params)
+    advantage = npvs['A'] - npvs['B']
+    band = np.digitize(rates, RATE_BANDS[1:-1])
+    num_bands = len(RATE_BANDS) - 1
+    return {
+        'paths': n,
+        'sums': {'A': npvs['A'].sum(), 'B': npvs['B'].sum(), 'Advantage A': advantage.sum()},
+        'histograms': {'A': _bin_counts(npvs['A'], 'A'), 'B': _bin_counts(npvs['B'], 'B'),
+                       'Advantage A': _bin_counts(advantage, 'Advantage A')},
+        'band_paths': np.bincount(band, minlength=num_bands),
+        'band_wins': np.bincount(band, weights=advantage > 0, minlength=num_bands).astype(np.int64),
+    }
+
+
+def _merge(total, part):
+    if total is None:
+        return part
+    total['paths'] += part['paths']
+    for name in _NPV_SERIES:
+        total['sums'][name] += part['sums'][name]
+        total['histograms'][name] += part['histograms'][name]
+    total['band_paths'] += part['band_paths']
+    total['band_wins'] += part['band_wins']
+    return total
+
+
+@traced('monte carlo simulation')
+def run_simulation(n_paths=DEFAULT_PATHS, seed=DEFAULT_SEED, chunk_size=CHUNK_SIZE,
+                   workers=1, params=None):
+    """
+    Run n_paths paths in chunks, in a process pool when workers > 1.
+
+    Chunk k always draws from the k-th child of SeedSequence(seed), so a
+    given seed, path count and chunk size reproduce the same result for
+    any number of workers.
+    """
+    sizes = [chunk_size] * (n_paths // chunk_size)
+    if n_paths % chunk_size:
+        sizes.append(n_paths % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    total = None
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for part in executor.map(simulate_chunk, seeds, sizes, [params] * len(sizes)):
+                total = _merge(total, part)
+    else:
+        for chunk_seed, size in zip(seeds, sizes):
+            total = _merge(total, simulate_chunk(chunk_seed, size, params))
+    return total
+
+
+def _percentile(counts, name, q):
+    """Percentile q of a histogram, interpolating within the bin"""
+    lo, _ = _histogram_range(name)
+    cumulative = np.cumsum(counts)
+    target = q / 100 * cumulative[-1]
+    index = int(np.searchsorted(cumulative, target))
+    below = cumulative[index - 1] if index else 0
+    fraction = (target - below) / counts[index] if counts[index] else 0.0
+    return lo + (index + fraction) * BIN_WIDTH
+
+
+def percentile_table(result, percentiles=PERCENTILES):
+    """NPV mean and percentiles ($M) for A, B and A's advantage"""
+    rows = []
+    for name in _NPV_SERIES:
+        label = 'NPV Advantage A ($M)' if name == 'Advantage A' else f'Investment {name} NPV ($M)'
+        row = {'Series': label, 'Mean': result['sums'][name] / result['paths']}
+        for q in percentiles:
+            row[f'P{q}'] = _percentile(result['histograms'][name], name, q)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def superiority_table(result):
+    """Probability that A's NPV beats B's, overall and by discount-rate band"""
+    rows = []
+    for i, (low, high) in enumerate(zip(RATE_BANDS[:-1], RATE_BANDS[1:])):
+        if i == 0:
+            band = f"< {high * 100:.0f}%"
+        elif i == len(RATE_BANDS) - 2:
+            band = f"≥ {low * 100:.0f}%"
+        else:
+            band = f"{low * 100:.0f}–{high * 100:.0f}%"
+        paths = result['band_paths'][i]
+        rows.append({'Discount Rate': band, 'Paths': int(paths),
+                     'P(A > B)': result['band_wins'][i] / paths if paths else np.nan})
+    rows.append({'Discount Rate': 'All paths', 'Paths': int(result['paths']),
+                 'P(A > B)': result['band_wins'].sum() / result['paths']})
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo NPV comparison of Investments A and B")
+    parser.add_argument('--paths', type=int, default=DEFAULT_PATHS)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    result = run_simulation(args.paths, args.seed, args.chunk_size, args.workers)
+    print(f"MONTE CARLO NPV ({result['paths']:,} paths, seed {args.seed})")
+    print("-" * 60)
+    print(percentile_table(result).round(1).to_markdown(index=False, tablefmt="grid"))
+    print()
+    print(superiority_table(result).round(3).to_markdown(index=False, tablefmt="grid"))
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Multi-Issuer Panel
+Panel data keyed by (ticker, fiscal year) and the outline's section summaries
+computed for every issuer at once with vectorized groupby aggregations
+
+A single-issuer frame (the Ford workbook) is simply a panel with one ticker,
+so the outline script and a 500-company × 20-year panel share the same code
+path: first/last years, year counts and peak years all come from the data
+instead of being hard-coded.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from ford_data_loader import load_financial_data
+from ford_metrics import OUTLINE_RATIOS, add_ratios
+
+TICKER = 'Ticker'
+YEAR = 'Year Ended'
+DEFAULT_TICKER = 'F'
+
+# Summary column -> (source column, groupby aggregation). 'first'/'last'
+# are the earliest/latest fiscal year because panels are kept year-sorted.
+OUTLINE_AGGREGATES = {
+    'First Year': (YEAR, 'first'),
+    'Last Year': (YEAR, 'last'),
+    'Years': (YEAR, 'count'),
+    # Section 1: revenue & profitability
+    'Revenue Min ($B)': ('Revenue ($B)', 'min'),
+    'Revenue Max ($B)': ('Revenue ($B)', 'max'),
+    'Operating Income Min ($B)': ('Operating Income ($B)', 'min'),
+    'Operating Income Max ($B)': ('Operating Income ($B)', 'max'),
+    'Peak Net Income ($B)': ('Net Income ($B)', 'max'),
+    'Avg Operating Margin %': ('Operating Margin %', 'mean'),
+    'Avg Net Margin %': ('Net Margin %', 'mean'),
+    # Section 2: cash flow & capex
+    'CFO Min ($B)': ('Cash Flow from Ops ($B)', 'min'),
+    'CFO Max ($B)': ('Cash Flow from Ops ($B)', 'max'),
+    'Avg CFO ($B)': ('Cash Flow from Ops ($B)', 'mean'),
+    'Avg Capex ($B)': ('Capex ($B)', 'mean'),
+    'FCF Total ($B)': ('Free Cash Flow ($B)', 'sum'),
+    # Section 3: balance sheet & debt
+    'Total Assets First ($B)': ('Total Assets ($B)', 'first'),
+    'Total Assets Last ($B)': ('Total Assets ($B)', 'last'),
+    'Total Debt Min ($B)': ('Total Debt ($B)', 'min'),
+    'Total Debt Max ($B)': ('Total Debt ($B)', 'max'),
+    'Total Debt Last ($B)': ('Total Debt ($B)', 'last'),
+    'Cash Last ($B)': ('Cash & Equivalents ($B)', 'last'),
+    'Cash Max ($B)': ('Cash & Equivalents ($B)', 'max'),
+    # Section 4: liquidity & leverage
+    'Current Ratio Min': ('Current Ratio', 'min'),
+    'Current Ratio Max': ('Current Ratio', 'max'),
+    'Current Ratio Last': ('Current Ratio', 'last'),
+    'Debt to Equity Min': ('Debt to Equity', 'min'),
+    'Debt to Equity Max': ('Debt to Equity', 'max'),
+    'Debt to Equity Last': ('Debt to Equity', 'last'),
+    # Section 5: risks & patterns
+    'Capex First ($B)': ('Capex ($B)', 'first'),
+    'Capex Last ($B)': ('Capex ($B)', 'last'),
+}
+
+# Summary column -> (source column, sign): number of years the column is
+# above zero (sign 1) or below zero (sign -1)
+OUTLINE_COUNTS = {
+    'Positive FCF Years': ('Free Cash Flow ($B)', 1),
+    'Loss Years': ('Net Income ($B)', -1),
+}
+
+# Summary column -> (source column, 'idxmin' / 'idxmax'): the fiscal year
+# in which the column reaches its extreme
+OUTLINE_EXTREME_YEARS = {
+    'Revenue Min Year': ('Revenue ($B)', 'idxmin'),
+    'Revenue Max Year': ('Revenue ($B)', 'idxmax'),
+    'Peak Net Income Year': ('Net Income ($B)', 'idxmax'),
+    'Cash Max Year': ('Cash & Equivalents ($B)', 'idxmax'),
+}
+
+# Workbook/ratio columns outline_summary reads
+OUTLINE_COLUMNS = list(dict.fromkeys(
+    [YEAR] + [column for column, _ in OUTLINE_AGGREGATES.values()]
+    + [column for column, _ in OUTLINE_COUNTS.values()]
+    + [column for column, _ in OUTLINE_EXTREME_YEARS.values()]))
+
+
+def as_panel(df, ticker=DEFAULT_TICKER):
+    """
+    Return df as a panel sorted by (ticker, fiscal year) with a 0..n-1 index.
+
+    Frames without a Ticker column are treated as a single issuer. The index
+    is always reset, so row labels double as positions even for filtered or
+    re-indexed frames; under copy-on-write the values are only copied when a
+    column has to be added or rows reordered.
+    """
+    if TICKER not in df.columns:
+        df = df.assign(**{TICKER: ticker})
+    keys = df[[TICKER, YEAR]]
+    if not (keys[TICKER].is_monotonic_increasing
+            and keys.groupby(TICKER, sort=False)[YEAR].is_monotonic_increasing.all()):
+        return df.sort_values([TICKER, YEAR], kind='stable', ignore_index=True)
+    return df.reset_index(drop=True)
+
+
+def combine_issuers(frames):
+    """Stack {ticker: single-issuer DataFrame} into one panel"""
+    return as_panel(pd.concat([df.assign(**{TICKER: ticker}) for ticker, df in frames.items()],
+                              ignore_index=True))
+
+
+def load_panel(path):
+    """Read a panel from .csv, .xlsx or a loader .npz cache; it must have a Ticker column"""
+    if path.endswith('.csv'):
+        df = pd.read_csv(path)
+    elif path.endswith('.npz'):
+        from ford_data_loader import _read_cache
+        df = _read_cache(path)
+    else:
+        df = pd.read_excel(path)
+    if TICKER not in df.columns:
+        raise ValueError(f"{path} has no '{TICKER}' column")
+    return as_panel(df)
+
+
+def synthetic_panel(companies, years=10, seed=0):
+    """
+    A panel of synthetic issuers built from the Ford workbook.
+
+    Each issuer cycles through Ford's fiscal years (relabelled to end in
+    Ford's latest year) with every value scaled by lognormal noise, so
+    ratios stay in realistic ranges.
+    """
+    base = load_financial_data()
+    rng = np.random.default_rng(seed)
+    rows = companies * years
+    order = np.tile(np.arange(years) % len(base), companies)
+    panel = base.iloc[order].reset_index(drop=True)
+
+    numeric = [col for col in panel.columns if col != YEAR]
+    noise = rng.lognormal(0.0, 0.15, size=(rows, len(numeric)))
+    panel[numeric] = panel[numeric].to_numpy(dtype=np.float64) * noise
+    panel[YEAR] = np.tile(np.arange(years) + int(base[YEAR].max()) - years + 1, companies)
+    panel.insert(0, TICKER, np.repeat([f'C{i:05d}' for i in range(companies)], years))
+    return panel
+
+
+def outline_summary(panel):
+    """
+    One row per ticker with every figure the outline sections report.
+
+    panel must carry the OUTLINE_RATIOS columns. All statistics come from a
+    handful of groupby passes, however many issuers the panel holds.
+    """
+    panel = as_panel(panel)
+    grouped = panel.groupby(TICKER, sort=False)
+    summary = grouped.agg(**{name: pd.NamedAgg(column, how)
+                             for name, (column, how) in OUTLINE_AGGREGATES.items()})
+
+    flags = pd.DataFrame({name: np.sign(panel[column].to_numpy()) == sign
+                          for name, (column, sign) in OUTLINE_COUNTS.items()})
+    flags[TICKER] = panel[TICKER].to_numpy()
+    counts = flags.groupby(TICKER, sort=False).sum()
+    for name in OUTLINE_COUNTS:
+        summary[name] = counts[name]
+
+    years = panel[YEAR].to_numpy()
+    for name, (column, how) in OUTLINE_EXTREME_YEARS.items():
+        summary[name] = years[getattr(grouped[column], how)().to_numpy()]
+    return summary
+
+
+def check_index_labels(df):
+    """
+    Run outline_summary on year-filtered and re-indexed copies of df (which
+    must carry the OUTLINE_RATIOS columns) and return the names of the copies
+    whose extreme years or figures are wrong; empty when every copy agrees
+    """
+    variants = {
+        'year-filtered': df[df[YEAR] > df[YEAR].min() + 1],
+        'offset index': df.set_index(df.index + 100),
+        'gapped index': df.set_index(df.index * 3),
+    }
+    failed = []
+    for name, frame in variants.items():
+        try:
+            summary = outline_summary(frame)
+        except (IndexError, KeyError):
+            failed.append(name)
+            continue
+        issuer = as_panel(frame)
+        years = {label: issuer.loc[getattr(issuer[column], how)(), YEAR]
+                 for label, (column, how) in OUTLINE_EXTREME_YEARS.items()}
+        expected = outline_summary(issuer.reset_index(drop=True))
+        if not (summary.equals(expected)
+                and all(summary[label].iloc[0] == year for label, year in years.items())):
+            failed.append(name)
+    return failed
+
+
+def loss_years(panel):
+    """{ticker: [fiscal years with a net loss]}"""
+    panel = as_panel(panel)
+    losses = panel.loc[panel['Net Income ($B)'].to_numpy() < 0, [TICKER, YEAR]]
+    years = losses.groupby(TICKER, sort=False)[YEAR].agg(list)
+    return {ticker: years.get(ticker, []) for ticker in panel[TICKER].unique()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Outline summaries for every issuer in a panel")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', help="panel file (.csv, .xlsx or .npz) with a Ticker column")
+    source.add_argument('--synthetic', type=int, metavar='COMPANIES',
+                        help="generate a synthetic panel of this many issuers")
+    source.add_argument('--check', action='store_true',
+                        help="check the summary on filtered and re-indexed workbook frames")
+    parser.add_argument('--years', type=int, default=20, help="fiscal years per synthetic issuer")
+    parser.add_argument('--output', default='ford_panel_summary.csv')
+    args = parser.parse_args()
+
+    if args.check:
+        failed = check_index_labels(add_ratios(load_financial_data(), OUTLINE_RATIOS))
+        if failed:
+            sys.exit(f"✗ Wrong outline summary for: {', '.join(failed)}")
+        print("✓ Outline summary matches on year-filtered and re-indexed frames")
+        sys.exit(0)
+
+    panel = load_panel(args.input) if args.input else synthetic_panel(args.synthetic, args.years)
+    start = time.perf_counter()
+    add_ratios(panel, OUTLINE_RATIOS)
+    summary = outline_summary(panel)
+    elapsed = time.perf_counter() - start
+
+    summary.to_csv(args.output)
+    print(f"✓ {len(summary):,} issuers × {len(panel) / max(len(summary), 1):.0f} years "
+          f"summarised in {elapsed:.2f}s → {args.output}")
+    print(summary[['Years', 'Revenue Max ($B)', 'Avg Operating Margin %', 'FCF Total ($B)',
+                   'Positive FCF Years', 'Debt to Equity Last']].head(10).round(2)
+          .to_markdown(tablefmt="grid"))
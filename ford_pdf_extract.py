@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - 10-K Financial Statement Extraction
+Parses the consolidated income statement, balance sheet and cash-flow pages of
+each filing in 10k/ and emits rows with the same columns as the 'Inputs' sheet
+of the ratio workbook
+
+Statement pages are located once per filing and remembered in a page index
+keyed by the PDF's content hash, so later runs only read three pages per file.
+Requires the optional pypdf package.
+
+--reconcile compares the extracted rows with the workbook. FY2019 and FY2020
+differ in a few known places (KNOWN_DEVIATIONS); any other difference fails.
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from ford_data_loader import CACHE_DIR, atomic_write_json, file_hash, read_json
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional: only needed for PDF extraction
+    PdfReader = None
+
+FILINGS_DIR = '10k'
+PAGE_INDEX_PATH = os.path.join(CACHE_DIR, 'page_index.json')
+DEFAULT_ISSUER = 'FORD MOTOR COMPANY AND SUBSIDIARIES'
+
+INPUT_COLUMNS = ['Year Ended', 'Revenue ($B)', 'COGS ($B)', 'Operating Income ($B)',
+                 'Net Income ($B)', 'EBIT ($B)', 'Interest Expense ($B)',
+                 'Income Tax Expense ($B)', 'Total Assets ($B)', 'Total Liabilities ($B)',
+                 'Shareholders Equity ($B)', 'Cash & Equivalents ($B)', 'Current Assets ($B)',
+                 'Inventory ($B)', 'Current Liabilities ($B)', 'Total Debt ($B)',
+                 'Cash Flow from Ops ($B)', 'Capex ($B)']
+
+# Statement page headings (matched at the start of a page's opening lines)
+STATEMENT_HEADINGS = {
+    'income': re.compile(r'CONSOLIDATED INCOME STATEMENTS?\b'),
+    'balance': re.compile(r'CONSOLIDATED BALANCE SHEETS?\b'),
+    'cash_flow': re.compile(r'CONSOLIDATED STATEMENTS? OF CASH FLOWS\b'),
+}
+
+# Line-item labels per statement; the first matching line wins. Keys starting
+# with '_' are intermediate values used to derive other columns.
+LINE_ITEMS = {
+    'income': {
+        'Revenue ($B)': r'Total revenues',
+        'COGS ($B)': r'Cost of sales',
+        'Operating Income ($B)': r'Operating income(/\(loss\))?',
+        'Net Income ($B)': r'Net income(/\(loss\))?',
+        'Income Tax Expense ($B)': r'Provision for/\(Benefit from\) income taxes',
+        '_pretax': r'Income(/\(Loss\))? before income taxes',
+    },
+    'balance': {
+        'Cash & Equivalents ($B)': r'Cash and cash equivalents',
+        'Inventory ($B)': r'Inventories',
+        'Current Assets ($B)': r'Total current assets',
+        'Total Assets ($B)': r'Total assets',
+        'Current Liabilities ($B)': r'Total current liabilities',
+        'Total Liabilities ($B)': r'Total liabilities',
+        'Shareholders Equity ($B)': r'Total equity',
+    },
+    'cash_flow': {
+        'Cash Flow from Ops ($B)': r'Net cash provided by/\(used in\) operating activities',
+        'Capex ($B)': r'Capital spending',
+    },
+}
+LINE_ITEMS = {statement: {col: re.compile(pattern + r'$') for col, pattern in items.items()}
+              for statement, items in LINE_ITEMS.items()}
+
+# Debt lines are summed: newer filings list "Company excluding Ford Credit" and
+# "Ford Credit" under each debt heading, older ones name each debt line in full
+DEBT_LINE = re.compile(r'(Company excluding Ford Credit|Ford Credit'
+                       r'|(Automotive|Ford Credit|Other)( long-term debt| debt payable within one year))$')
+
+# Interest lines are summed the same way: older filings split "Company debt
+# excluding Ford Credit" into Automotive debt and Other debt, as later filings'
+# restated comparatives confirm (FY2019: 963 + 57 = 1,020)
+INTEREST_LINE = re.compile(r'Interest expense on (Company debt excluding Ford Credit'
+                           r'|Automotive debt|Other debt)$')
+
+# Where the workbook's FY2019/FY2020 inputs differ from the filings, and why.
+# EBIT is pretax income plus interest, so it inherits the interest difference.
+_INTEREST_NOTE = "workbook figure matches no statement line; the filing's total is used"
+_DEBT_NOTE = ("workbook leaves out Other debt, which later filings include under "
+              "Company excluding Ford Credit")
+KNOWN_DEVIATIONS = {
+    (2019, 'Net Income ($B)'): "workbook has 0.84; the filing reports $84M",
+    (2019, 'Interest Expense ($B)'): _INTEREST_NOTE,
+    (2020, 'Interest Expense ($B)'): _INTEREST_NOTE,
+    (2019, 'EBIT ($B)'): "follows the interest expense difference",
+    (2020, 'EBIT ($B)'): "follows the interest expense difference",
+    (2019, 'Total Debt ($B)'): _DEBT_NOTE,
+    (2020, 'Total Debt ($B)'): _DEBT_NOTE,
+}
+
+# Largest difference from the workbook put down to rounding ($B); summed
+# lines are rounded once here but line by line in the workbook
+RECONCILE_TOLERANCE = 0.015
+
+_AMOUNT = re.compile(r'\(\d[\d,]*(\.\d+)?\)|\d[\d,]*(\.\d+)?|—|\$')
+_NOTE_REF = re.compile(r'\s*\(Note \d+( and Note \d+)?\)')
+_YEAR = re.compile(r'\b(19|20)\d{2}\b')
+
+
+def _require_pypdf():
+    if PdfReader is None:
+        raise ImportError("PDF extraction requires pypdf: pip install pypdf")
+
+
+def fiscal_year_from_filename(path):
+    """Read the fiscal year from names like '... for Year End 2019 - filed ...'"""
+    match = re.search(r'Year End (\d{4})', os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+
+def _split_amounts(line):
+    """Split a statement line into (label, [amounts in millions])"""
+    tokens = line.split()
+    amounts = []
+    while tokens and _AMOUNT.fullmatch(tokens[-1]):
+        token = tokens.pop()
+        if token == '$':
+            continue
+        if token == '—':
+            amounts.append(0.0)
+        elif token.startswith('('):
+            amounts.append(-float(token.strip('()').replace(',', '')))
+        else:
+            amounts.append(float(token.replace(',', '')))
+    label = _NOTE_REF.sub('', ' '.join(tokens)).strip()
+    return label, amounts[::-1]
+
+
+def _column_years(text):
+    """Years in the statement's column header, in column order"""
+    header = []
+    for line in text.splitlines()[:12]:
+        if re.fullmatch(r'[\s\d]*', line) or line.strip().startswith('December 31'):
+            header.extend(int(m.group(0)) for m in _YEAR.finditer(line))
+    return header
+
+
+def _pick(amounts, years, fiscal_year):
+    """Select the fiscal-year column, falling back to the last column"""
+    if len(amounts) == len(years) and fiscal_year in years:
+        return amounts[years.index(fiscal_year)]
+    return amounts[-1]
+
+
+def parse_statement(text, statement, fiscal_year):
+    """Extract the known line items from one statement page (values in $B)"""
+    years = _column_years(text)
+    patterns = LINE_ITEMS[statement]
+    values = {}
+    debt = []
+    interest = []
+
+    for line in text.splitlines():
+        label, amounts = _split_amounts(line)
+        if not amounts or not label:
+            continue
+        for col, pattern in patterns.items():
+            if col not in values and pattern.match(label):
+                values[col] = _pick(amounts, years, fiscal_year)
+                break
+        if statement == 'balance' and DEBT_LINE.match(label):
+            debt.append(_pick(amounts, years, fiscal_year))
+        if statement == 'income' and INTEREST_LINE.match(label):
+            interest.append(_pick(amounts, years, fiscal_year))
+
+    if debt:
+        values['Total Debt ($B)'] = sum(debt)
+    if interest:
+        values['Interest Expense ($B)'] = sum(interest)
+    return {col: value / 1000 for col, value in values.items()}
+
+
+def locate_statements(path, issuer=DEFAULT_ISSUER):
+    """
+    Full-document scan for the three statement pages, streamed page by page.
+
+    A page qualifies when the issuer name and a statement heading open the
+    page as separate lines; among qualifying pages the one with the most
+    amounts wins (this skips note pages that continue a statement's title).
+    """
+    from ford_pdf_stream import stream_pages
+
+    best = {}
+    for number, text in stream_pages(path):
+        top = [line.strip().upper() for line in text.splitlines()[:4] if line.strip()]
+        if issuer not in top:
+            continue
+        for statement, heading in STATEMENT_HEADINGS.items():
+            if any(heading.match(line) for line in top):
+                score = sum(1 for line in text.splitlines() if _split_amounts(line)[1])
+                if score > best.get(statement, (-1, None))[0]:
+                    best[statement] = (score, number)
+    return {statement: number for statement, (score, number) in best.items()}
+
+
+def extract_filing(path, pages=None, issuer=DEFAULT_ISSUER):
+    """
+    Extract one filing. pages is the cached page index entry, if any.
+
+    Returns (row dict, page index entry).
+    """
+    from ford_pdf_stream import stream_pages
+
+    _require_pypdf()
+    if pages is None:
+        pages = locate_statements(path, issuer)
+
+    # Layout mode keeps each label on the same line as its amounts
+    texts = dict(stream_pages(path, pages=set(pages.values()), layout=True))
+    fiscal_year = fiscal_year_from_filename(path)
+    row = {'Year Ended': fiscal_year}
+    for statement, number in pages.items():
+        text = texts[number]
+        if fiscal_year is None:
+            years = _column_years(text)
+            fiscal_year = row['Year Ended'] = max(years) if years else None
+        row.update(parse_statement(text, statement, fiscal_year))
+
+    if '_pretax' in row:
+        pretax = row.pop('_pretax')
+        row['EBIT ($B)'] = pretax + row.get('Interest Expense ($B)', 0.0)
+    if 'Capex ($B)' in row:
+        row['Capex ($B)'] = abs(row['Capex ($B)'])
+    return row, pages
+
+
+def load_page_index(path=PAGE_INDEX_PATH):
+    return read_json(path, {})
+
+
+def save_page_index(index, path=PAGE_INDEX_PATH):
+    atomic_write_json(path, index, indent=2, sort_keys=True)
+
+
+def extract_filings(paths, workers=1, issuer=DEFAULT_ISSUER, index_path=PAGE_INDEX_PATH):
+    """
+    Extract every filing in paths, in a process pool when workers > 1.
+
+    Returns a DataFrame with INPUT_COLUMNS, one row per fiscal year, sorted by
+    year. Columns a filing does not report are left as NaN.
+    """
+    _require_pypdf()
+    index = load_page_index(index_path)
+    hashes = [file_hash(path) for path in paths]
+    cached = [index.get(digest) for digest in hashes]
+
+    if workers <= 1:
+        results = [extract_filing(path, pages, issuer) for path, pages in zip(paths, cached)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(extract_filing, paths, cached,
+                                        [issuer] * len(paths)))
+
+    for digest, (row, pages) in zip(hashes, results):
+        index[digest] = pages
+    save_page_index(index, index_path)
+
+    # Filings without Ford statement pages (e.g. the 10-K/A exhibits) yield no row
+    rows = [row for row, pages in results if pages and row['Year Ended'] is not None]
+    df = pd.DataFrame(rows).reindex(columns=INPUT_COLUMNS)
+    df = df.drop_duplicates('Year Ended', keep='first').sort_values('Year Ended')
+    df['Year Ended'] = df['Year Ended'].astype(int)
+    numeric = INPUT_COLUMNS[1:]
+    df[numeric] = np.round(df[numeric].astype(float), 2)
+    return df.reset_index(drop=True)
+
+
+def reconcile(extracted, workbook, tolerance=RECONCILE_TOLERANCE):
+    """
+    Differences between extracted rows and the workbook beyond tolerance.
+
+    Returns a DataFrame of year, column, extracted, workbook, difference and
+    the KNOWN_DEVIATIONS note ('' when the difference is unexplained). Years
+    missing from either side are skipped.
+    """
+    extracted = extracted.set_index('Year Ended')
+    workbook = workbook.set_index('Year Ended')
+    years = extracted.index.intersection(workbook.index)
+    rows = []
+    for column in INPUT_COLUMNS[1:]:
+        for year in years:
+            ours, theirs = extracted.at[year, column], workbook.at[year, column]
+            if pd.isna(ours) or abs(ours - theirs) > tolerance:
+                rows.append({'year': int(year), 'column': column, 'extracted': ours,
+                             'workbook': theirs, 'difference': ours - theirs,
+                             'note': KNOWN_DEVIATIONS.get((int(year), column), '')})
+    table = pd.DataFrame(rows, columns=['year', 'column', 'extracted', 'workbook',
+                                        'difference', 'note'])
+    return table.sort_values(['year', 'column'], ignore_index=True)
+
+
+def list_filings(directory=FILINGS_DIR, canonical_only=True):
+    """PDFs in directory, skipping duplicate variants of the same filing"""
+    paths = sorted(glob.glob(os.path.join(directory, '*.pdf')))
+    if canonical_only:
+        from ford_filing_catalog import canonical_filings
+        paths = canonical_filings(paths)
+    return paths
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract ratio-workbook inputs from 10-K PDFs")
+    parser.add_argument('--dir', default=FILINGS_DIR, help="directory of 10-K PDFs")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="number of extraction processes (1 runs serially)")
+    parser.add_argument('--issuer', default=DEFAULT_ISSUER,
+                        help="entity name printed at the top of statement pages")
+    parser.add_argument('--output', default='Ford_10K_Extracted_Inputs.xlsx',
+                        help="workbook to write (sheet 'Inputs')")
+    parser.add_argument('--reconcile', action='store_true',
+                        help="compare with the workbook; exit 1 on an unexplained difference")
+    args = parser.parse_args()
+
+    extracted = extract_filings(list_filings(args.dir), workers=args.workers, issuer=args.issuer)
+    extracted.to_excel(args.output, sheet_name='Inputs', index=False)
+    print(extracted.to_string(index=False))
+    print(f"\n✓ Extracted {len(extracted)} fiscal years → {args.output}")
+
+    if args.reconcile:
+        from ford_data_loader import load_financial_data
+        differences = reconcile(extracted, load_financial_data(appended_path=None))
+        if len(differences):
+            print(differences.round(2).to_markdown(index=False, tablefmt="grid"))
+        unexplained = differences[differences['note'] == '']
+        if len(unexplained):
+            sys.exit(f"✗ {len(unexplained)} unexplained difference(s) from the workbook")
+        print(f"✓ Matches the workbook within ${RECONCILE_TOLERANCE}B "
+              f"apart from {len(differences)} known deviation(s)")
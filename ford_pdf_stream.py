@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Streaming PDF Text Extraction
+Yields a filing's page text and table blocks one page at a time, so long
+documents such as the annual reports are processed in bounded memory
+
+pypdf keeps every object it has parsed cached on the reader, which grows with
+each page read. The stream re-opens the reader every few pages (and straight
+away when RSS has grown past a ceiling since streaming began), dropping that
+cache so peak RSS stays flat regardless of document length. Requires the
+optional pypdf package.
+"""
+
+import argparse
+import gc
+import resource
+import sys
+from collections import namedtuple
+
+from ford_pdf_extract import _split_amounts
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # optional: only needed to read PDFs
+    PdfReader = None
+
+# RSS growth (since the stream started or last re-opened for memory) above
+# which the reader cache is dropped before the next page
+MAX_MEMORY_MB = 256
+
+# Pages read between reader re-opens
+RECYCLE_PAGES = 32
+
+# Consecutive amount lines needed to count as a table block
+MIN_TABLE_ROWS = 3
+
+PageText = namedtuple('PageText', ['page', 'text'])
+TableBlock = namedtuple('TableBlock', ['page', 'rows'])
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    scale = 2**20 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def current_rss_mb():
+    """Resident set size of this process in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        return peak_rss_mb()
+
+
+def table_blocks(text, page=0, min_rows=MIN_TABLE_ROWS):
+    """
+    Split layout-mode page text into runs of statement lines.
+
+    Each TableBlock's rows are (label, [amounts]) pairs; a run ends at the
+    first line without amounts, and runs shorter than min_rows are dropped.
+    """
+    blocks = []
+    rows = []
+    for line in text.splitlines() + ['']:
+        label, amounts = _split_amounts(line)
+        if amounts:
+            rows.append((label, amounts))
+            continue
+        if len(rows) >= min_rows:
+            blocks.append(TableBlock(page, rows))
+        rows = []
+    return blocks
+
+
+def stream_pages(path, pages=None, layout=False, max_memory_mb=MAX_MEMORY_MB,
+                 recycle_pages=RECYCLE_PAGES):
+    """
+    Yield PageText(page number, text) for each page of path, in order.
+
+    pages restricts the stream to those 0-based page numbers. layout selects
+    pypdf's layout mode, which keeps table labels on the same line as their
+    amounts. max_memory_mb bounds RSS growth rather than absolute RSS, so a
+    process that is already large does not re-open the reader on every page.
+    """
+    if PdfReader is None:
+        raise ImportError("Reading PDFs requires pypdf: pip install pypdf")
+    mode = 'layout' if layout else 'plain'
+
+    # Reading from the open file keeps the PDF's bytes out of memory too
+    with open(path, 'rb') as f:
+        reader = PdfReader(f)
+        numbers = range(len(reader.pages)) if pages is None else sorted(pages)
+        since_open = 0
+        baseline = current_rss_mb()
+        for number in numbers:
+            over_memory = current_rss_mb() - baseline > max_memory_mb
+            if since_open >= recycle_pages or over_memory:
+                del reader
+                gc.collect()
+                reader = PdfReader(f)
+                since_open = 0
+                if over_memory:
+                    # Freed pages are often kept by the allocator (and the
+                    # fallback peak never drops): measure growth from here
+                    baseline = current_rss_mb()
+            text = reader.pages[number].extract_text(extraction_mode=mode) or ''
+            since_open += 1
+            yield PageText(number, text.replace('\xa0', ' '))
+
+
+def stream_document(path, pages=None, min_rows=MIN_TABLE_ROWS, **kwargs):
+    """
+    Yield each page's PageText followed by its TableBlocks.
+
+    Text is read in layout mode; kwargs are passed to stream_pages.
+    """
+    for page in stream_pages(path, pages=pages, layout=True, **kwargs):
+        yield page
+        yield from table_blocks(page.text, page.page, min_rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream a PDF's pages and table blocks")
+    parser.add_argument('path')
+    parser.add_argument('--max-memory-mb', type=float, default=MAX_MEMORY_MB)
+    parser.add_argument('--tables', action='store_true', help="also detect table blocks")
+    args = parser.parse_args()
+
+    items = (stream_document(args.path, max_memory_mb=args.max_memory_mb) if args.tables
+             else stream_pages(args.path, max_memory_mb=args.max_memory_mb))
+    num_pages = num_blocks = num_rows = 0
+    for item in items:
+        if isinstance(item, TableBlock):
+            num_blocks += 1
+            num_rows += len(item.rows)
+        else:
+            num_pages += 1
+    print(f"✓ Streamed {num_pages} pages from {args.path}")
+    if args.tables:
+        print(f"✓ {num_blocks} table blocks, {num_rows} rows")
+    print(f"✓ Peak RSS {peak_rss_mb():.0f} MB")
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Analysis Pipeline
+Runs the whole toolkit from one entry point as a dependency graph:
+
+    load → metrics → summary / memo tables / summary CSV / dashboard / each chart
+                     / web chart dataset
+    load → running aggregates → summary / memo tables / summary CSV
+    works-cited (independent)
+
+The workbook is loaded and the ratios computed once, into a memory-mapped
+metric store that every downstream step attaches to read-only, so worker
+processes share one copy of the data instead of unpickling their own. Steps
+whose inputs are ready run concurrently on a process pool (or a thread pool,
+with pyplot work serialised), and each step's console output is buffered and
+printed in graph order so runs read the same however the steps interleave.
+Charts, the dashboard, the CSV and the web dataset still go through the
+incremental build cache.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+
+from ford_build_cache import BuildManifest, build
+from ford_data_loader import load_financial_data
+from ford_metric_store import MetricStore, ensure_metric_store
+from ford_metrics import MEMO_RATIOS
+from ford_trace import span
+
+# func is called with the results of deps, in order; pyplot marks steps that
+# use matplotlib's global figure state and must not share a thread pool
+Task = namedtuple('Task', ['deps', 'func', 'pyplot'])
+
+# What a cached-output step returns: the manifest entry is merged by the runner
+BuildResult = namedtuple('BuildResult', ['output', 'rebuilt', 'entry'])
+
+_PYPLOT_LOCK = threading.Lock()
+_local = threading.local()
+
+
+class _ThreadStdout:
+    """Sends print() output to the calling thread's buffer while a step runs"""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = getattr(_local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        buffer = getattr(_local, 'buffer', None)
+        (buffer or self.stream).flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _capture_stdout():
+    """Route print() through _ThreadStdout until the with block exits"""
+    if isinstance(sys.stdout, _ThreadStdout):
+        return contextlib.nullcontext()
+    return contextlib.redirect_stdout(_ThreadStdout(sys.stdout))
+
+
+def _init_worker():
+    # A worker process only runs steps, so it keeps the wrapper until the pool
+    # shuts it down
+    if not isinstance(sys.stdout, _ThreadStdout):
+        sys.stdout = _ThreadStdout(sys.stdout)
+
+
+def _run_step(name, func, pyplot, args):
+    """Run one step with its output captured; returns (result, output, seconds)"""
+    _local.buffer = io.StringIO()
+    lock = _PYPLOT_LOCK if pyplot else contextlib.nullcontext()
+    start = time.perf_counter()
+    try:
+        with lock, span(name):
+            args = [arg.attach() if isinstance(arg, MetricStore) else arg for arg in args]
+            result = func(*args)
+        return result, _local.buffer.getvalue(), time.perf_counter() - start
+    finally:
+        _local.buffer = None
+
+
+# Steps. Each is a top-level function so it can be sent to a worker process.
+
+def load_step():
+    return load_financial_data()
+
+
+def metrics_step(df):
+    return ensure_metric_store(df, MEMO_RATIOS)
+
+
+def aggregates_step(df):
+    from ford_incremental import current_aggregates
+    return current_aggregates(df)
+
+
+def summary_step(df, aggregates):
+    from ford_analysis_per_outline import print_outline_summary
+    print_outline_summary(df, aggregates)
+
+
+def memo_tables_step(df, aggregates):
+    from generate_memo_tables import print_memo_tables
+    print_memo_tables(df, aggregates=aggregates)
+
+
+def _build_step(output, func, df, columns, params=None, code=None, force=False):
+    """
+    Build one output against a private manifest.
+
+    The manifest entry is returned in a BuildResult so the runner can merge
+    entries in one place instead of letting concurrent steps race on the
+    manifest file.
+    """
+    manifest = BuildManifest()
+    rebuilt = build(output, func, df, columns, params=params, code=code,
+                    manifest=manifest, force=force)
+    return BuildResult(output, rebuilt, manifest.entries.get(output))
+
+
+def summary_csv_step(df, aggregates, force=False):
+    import ford_analysis_per_outline as outline
+    return _build_step(outline.SUMMARY_CSV_PATH,
+                       partial(outline.write_summary_csv, aggregates=aggregates), df,
+                       outline.SUMMARY_COLUMNS, code=outline.SUMMARY_CODE, force=force)
+
+
+def dashboard_step(df, force=False):
+    import ford_analysis_per_outline as outline
+    outline.apply_style()
+    return _build_step(outline.DASHBOARD_PATH, outline.render_dashboard, df,
+                       outline.DASHBOARD_COLUMNS, params={'style': outline.SAVE_STYLE},
+                       code=[outline.render_dashboard, outline.calculate_pv_annuity], force=force)
+
+
+def chart_step(df, path, force=False):
+    import ford_separate_visualizations as charts
+    charts.apply_style()
+    render, columns, helpers = charts.CHART_TARGETS[path]
+    return _build_step(path, render, df, columns, params={'style': charts.SAVE_STYLE},
+                       code=[render, charts.save_figure] + helpers, force=force)
+
+
+def web_data_step(df, force=False):
+    import ford_web_data as web
+    return _build_step(web.DATASET_PATH, web.write_dataset, df, web.DATASET_COLUMNS,
+                       params=web.DATASET_PARAMS, code=web.DATASET_CODE, force=force)
+
+
+def works_cited_step():
+    from create_works_cited_v2 import create_works_cited
+    create_works_cited()
+
+
+def pipeline_tasks(force=False):
+    """The pipeline graph: {step name: Task}, in output order"""
+    from ford_separate_visualizations import CHART_TARGETS, chart_name
+
+    tasks = {
+        'load': Task([], load_step, False),
+        'metrics': Task(['load'], metrics_step, False),
+        'aggregates': Task(['load'], aggregates_step, False),
+        'summary': Task(['metrics', 'aggregates'], summary_step, False),
+        'memo_tables': Task(['metrics', 'aggregates'], memo_tables_step, False),
+        'summary_csv': Task(['metrics', 'aggregates'], partial(summary_csv_step, force=force),
+                            False),
+        'dashboard': Task(['metrics'], partial(dashboard_step, force=force), True),
+    }
+    for path in CHART_TARGETS:
+        tasks[chart_name(path)] = Task(['metrics'], partial(chart_step, path=path, force=force),
+                                        True)
+    tasks['web_data'] = Task(['metrics'], partial(web_data_step, force=force), False)
+    tasks['works_cited'] = Task([], works_cited_step, False)
+    return tasks
+
+
+def _ancestors(tasks, names):
+    seen = set()
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        if name not in seen:
+            seen.add(name)
+            stack.extend(tasks[name].deps)
+    return seen
+
+
+def _descendants(tasks, names):
+    selected = set(names)
+    changed = True
+    while changed:
+        changed = False
+        for name, task in tasks.items():
+            if name not in selected and selected & set(task.deps):
+                selected.add(name)
+                changed = True
+    return selected
+
+
+def select_steps(tasks, only=None, since=None):
+    """
+    Steps to run: every step by default, --only targets plus what they need,
+    or --since steps plus everything downstream of them (and their inputs).
+    """
+    unknown = [name for name in (only or []) + (since or []) if name not in tasks]
+    if unknown:
+        raise KeyError(f"Unknown step(s): {unknown}")
+    selected = set(tasks)
+    if only:
+        selected &= _ancestors(tasks, only)
+    if since:
+        selected &= _ancestors(tasks, _descendants(tasks, since))
+    return [name for name in tasks if name in selected]
+
+
+def run_pipeline(tasks, steps=None, executor='process', workers=None):
+    """
+    Run the selected steps, each as soon as its dependencies have finished.
+
+    Returns {step: (result, captured output, seconds)}. Build entries of chart,
+    dashboard and CSV steps are merged into the build manifest at the end.
+    Every dependency of a selected step must be selected too (select_steps
+    takes care of that); sys.stdout is restored when the run ends.
+    """
+    steps = list(tasks) if steps is None else steps
+    missing = sorted(_ancestors(tasks, steps) - set(steps))
+    if missing:
+        raise ValueError(f"Steps {steps} depend on unselected step(s): {missing}")
+    workers = workers or os.cpu_count() or 1
+    if executor == 'process':
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+
+    finished = {}
+    pending = list(steps)
+    running = {}
+    with _capture_stdout(), pool:
+        while pending or running:
+            for name in [n for n in pending if all(d in finished for d in tasks[n].deps)]:
+                task = tasks[name]
+                args = [finished[dep][0] for dep in task.deps]
+                running[pool.submit(_run_step, name, task.func, task.pyplot, args)] = name
+                pending.remove(name)
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[running.pop(future)] = future.result()
+
+    manifest = BuildManifest()
+    for name in steps:
+        result = finished[name][0]
+        if isinstance(result, BuildResult) and result.entry:
+            manifest.entries[result.output] = result.entry
+    manifest.save()
+    return {name: finished[name] for name in steps}
+
+
+def _split(values):
+    return [name for value in values or [] for name in value.split(',') if name]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Ford analysis pipeline")
+    parser.add_argument('--only', action='append',
+                        help="run only these steps (and what they need); comma-separated")
+    parser.add_argument('--since', action='append',
+                        help="run these steps and everything downstream; comma-separated")
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--force', action='store_true', help="rebuild cached charts and CSV")
+    parser.add_argument('--list', action='store_true', help="list the steps and exit")
+    args = parser.parse_args()
+
+    tasks = pipeline_tasks(force=args.force)
+    if args.list:
+        for name, task in tasks.items():
+            print(f"{name:<12} ← {', '.join(task.deps) or '(none)'}")
+        sys.exit(0)
+
+    try:
+        steps = select_steps(tasks, _split(args.only), _split(args.since))
+    except KeyError as exc:
+        parser.error(exc.args[0])
+
+    start = time.perf_counter()
+    results = run_pipeline(tasks, steps, args.executor, args.workers)
+    for name, (result, output, seconds) in results.items():
+        if output:
+            print(output, end='' if output.endswith('\n') else '\n')
+
+    print(f"\n✓ Pipeline finished in {time.perf_counter() - start:.1f}s")
+    for name, (result, output, seconds) in results.items():
+        status = ''
+        if isinstance(result, BuildResult):
+            status = ' (rebuilt)' if result.rebuilt else ' (unchanged)'
+        print(f"  {name:<12} {seconds:6.2f}s{status}")
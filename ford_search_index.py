@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Full-Text Search over the Filings
+Builds a positional inverted index with page-level postings for every PDF in
+10k/ and Annual Report/, and answers phrase and boolean queries against it
+
+Each document is indexed into its own segment (a memory-mapped .npy postings
+array plus a term table) keyed by the PDF's content hash, so adding a new
+filing only indexes that file. Requires the optional pypdf package.
+
+Query syntax:
+    "ford credit"                 phrase
+    special items                 both terms on the page (implicit AND)
+    "special items" AND 2021      explicit AND
+    pension OR opeb               either
+    "ford credit" NOT rivian      exclusion (also written -rivian)
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ford_data_loader import CACHE_DIR, atomic_write_json, file_hash, read_json
+from ford_pdf_stream import stream_pages
+
+SEARCH_DIRS = ['10k', 'Annual Report']
+INDEX_DIR = os.path.join(CACHE_DIR, 'search_index')
+MANIFEST_NAME = 'manifest.json'
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_QUERY_TOKEN = re.compile(r'-?"[^"]*"|\S+')
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def index_document(path):
+    """
+    Build one document's segment.
+
+    Returns (number of pages, {term: [start, end]}, postings) where postings
+    is an int32 array of (page, position) rows grouped by term.
+    """
+    positions = {}
+    num_pages = 0
+    for page_number, text in stream_pages(path):
+        num_pages += 1
+        for position, token in enumerate(tokenize(text)):
+            positions.setdefault(token, []).append((page_number, position))
+
+    terms = {}
+    chunks = []
+    start = 0
+    for term in sorted(positions):
+        rows = positions[term]
+        terms[term] = [start, start + len(rows)]
+        chunks.append(rows)
+        start += len(rows)
+
+    postings = np.array([row for rows in chunks for row in rows], dtype=np.int32).reshape(-1, 2)
+    return num_pages, terms, postings
+
+
+def _index_task(path):
+    return path, index_document(path)
+
+
+def list_documents(dirs=SEARCH_DIRS, canonical_only=True):
+    """PDFs in dirs, skipping duplicate variants of the same filing"""
+    paths = sorted(path for directory in dirs for path in glob.glob(os.path.join(directory, '*.pdf')))
+    if canonical_only:
+        from ford_filing_catalog import canonical_filings
+        paths = canonical_filings(paths)
+    return paths
+
+
+def _load_manifest(index_dir):
+    return read_json(os.path.join(index_dir, MANIFEST_NAME), {})
+
+
+def _save_manifest(manifest, index_dir):
+    atomic_write_json(os.path.join(index_dir, MANIFEST_NAME), manifest, indent=2, sort_keys=True)
+
+
+def build_index(paths=None, index_dir=INDEX_DIR, workers=1):
+    """
+    Bring the index up to date with paths (every PDF in SEARCH_DIRS by default).
+
+    Only files whose content hash has no segment yet are indexed; segments of
+    removed files are deleted. Returns (indexed paths, removed paths).
+    """
+    paths = list_documents() if paths is None else list(paths)
+    os.makedirs(index_dir, exist_ok=True)
+    manifest = _load_manifest(index_dir)
+
+    hashes = {path: file_hash(path) for path in paths}
+    known = {entry['hash'] for entry in manifest.values()}
+    pending = [path for path in paths if hashes[path] not in known]
+
+    by_hash = {entry['hash']: entry for entry in manifest.values()}
+
+    def store(result):
+        path, (num_pages, terms, postings) = result
+        segment = hashes[path][:16]
+        np.save(os.path.join(index_dir, segment + '.postings.npy'), postings)
+        atomic_write_json(os.path.join(index_dir, segment + '.terms.json'), terms)
+        by_hash[hashes[path]] = {'hash': hashes[path], 'segment': segment, 'pages': num_pages}
+        # Save after each document so an interrupted build keeps its progress
+        manifest[path] = by_hash[hashes[path]]
+        _save_manifest(manifest, index_dir)
+
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(_index_task, pending):
+                store(result)
+    else:
+        for path in pending:
+            store(_index_task(path))
+
+    # Re-point renamed files at their existing segments and drop stale entries
+    new_manifest = {path: by_hash[hashes[path]] for path in paths}
+    removed = [path for path in manifest if path not in new_manifest]
+    live_segments = {entry['segment'] for entry in new_manifest.values()}
+    for entry in manifest.values():
+        if entry['segment'] not in live_segments:
+            for suffix in ('.postings.npy', '.terms.json'):
+                segment_file = os.path.join(index_dir, entry['segment'] + suffix)
+                if os.path.exists(segment_file):
+                    os.remove(segment_file)
+    _save_manifest(new_manifest, index_dir)
+    return pending, removed
+
+
+class _Segment:
+    """One document's term table and memory-mapped postings"""
+
+    def __init__(self, index_dir, entry):
+        self.pages = entry['pages']
+        with open(os.path.join(index_dir, entry['segment'] + '.terms.json')) as f:
+            self.terms = json.load(f)
+        self.postings = np.load(os.path.join(index_dir, entry['segment'] + '.postings.npy'),
+                                mmap_mode='r')
+
+    def term_postings(self, term):
+        span = self.terms.get(term)
+        if span is None:
+            return np.empty((0, 2), dtype=np.int32)
+        return self.postings[span[0]:span[1]]
+
+    def phrase_pages(self, words):
+        """Pages containing the words consecutively"""
+        if not words:
+            return np.empty(0, dtype=np.int64)
+        n = len(words)
+        matches = None
+        for offset, word in enumerate(words):
+            rows = self.term_postings(word)
+            # Align every word on the phrase start: page << 32 | (position + n - offset)
+            keys = (rows[:, 0].astype(np.int64) << 32) | (rows[:, 1].astype(np.int64) + n - offset)
+            matches = keys if matches is None else np.intersect1d(matches, keys, assume_unique=True)
+            if matches.size == 0:
+                break
+        return np.unique(matches >> 32)
+
+    def all_pages(self):
+        return np.arange(self.pages, dtype=np.int64)
+
+
+def parse_query(query):
+    """
+    Parse a query into OR-groups of (negated, [words]) clauses.
+
+    AND binds tighter than OR; adjacent clauses are ANDed.
+    """
+    groups = [[]]
+    negate_next = False
+    for token in _QUERY_TOKEN.findall(query):
+        if token == 'OR':
+            groups.append([])
+            continue
+        if token == 'AND':
+            continue
+        if token == 'NOT':
+            negate_next = True
+            continue
+        negated = negate_next or token.startswith('-')
+        negate_next = False
+        words = tokenize(token.lstrip('-').strip('"'))
+        if words:
+            groups[-1].append((negated, words))
+    return [group for group in groups if group]
+
+
+class SearchIndex:
+    """Query API over the on-disk index"""
+
+    def __init__(self, index_dir=INDEX_DIR):
+        self.index_dir = index_dir
+        self.manifest = _load_manifest(index_dir)
+        self._segments = {}
+
+    def _segment(self, path):
+        if path not in self._segments:
+            self._segments[path] = _Segment(self.index_dir, self.manifest[path])
+        return self._segments[path]
+
+    def search(self, query, paths=None):
+        """Return [(path, page number starting at 1), ...] for pages matching query"""
+        groups = parse_query(query)
+        hits = []
+        for path in sorted(paths or self.manifest):
+            segment = self._segment(path)
+            matched = np.empty(0, dtype=np.int64)
+            for group in groups:
+                pages = None
+                for negated, words in group:
+                    if negated:
+                        pages = segment.all_pages() if pages is None else pages
+                        pages = np.setdiff1d(pages, segment.phrase_pages(words))
+                    else:
+                        found = segment.phrase_pages(words)
+                        pages = found if pages is None else np.intersect1d(pages, found)
+                matched = np.union1d(matched, pages)
+            hits.extend((path, int(page) + 1) for page in matched)
+        return hits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search the 10-K and annual report PDFs")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = subparsers.add_parser('build', help="index new or changed PDFs")
+    build_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+
+    search_parser = subparsers.add_parser('search', help="run a phrase/boolean query")
+    search_parser.add_argument('query')
+    search_parser.add_argument('--limit', type=int, default=50, help="maximum pages to list")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        indexed, removed = build_index(workers=args.workers)
+        print(f"✓ Indexed {len(indexed)} new document(s), removed {len(removed)}")
+        for path in indexed:
+            print(f"  + {path}")
+    else:
+        hits = SearchIndex().search(args.query)
+        documents = sorted({path for path, page in hits})
+        print(f"{len(hits)} page(s) in {len(documents)} document(s) match {args.query!r}")
+        for path, page in hits[:args.limit]:
+            print(f"  {path}  p.{page}")
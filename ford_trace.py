@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Stage Tracing
+Lightweight spans that record wall time, CPU time and peak traced memory for
+each stage of a script, exported as a Chrome trace (chrome://tracing or
+https://ui.perfetto.dev) and summarised on the console
+
+Tracing is off by default: span() then returns a shared no-op context and
+@traced functions run directly, so instrumented code costs one flag check.
+Set FORD_TRACE=trace.json to trace any script in the repo; the trace is
+written and the summary printed to stderr when the script exits.
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+TRACE_ENV = 'FORD_TRACE'
+
+_enabled = False
+_trace_memory = False
+_origin_ns = 0
+_events = []
+_local = threading.local()
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    """Timing context for one traced stage"""
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.max_seen = 0
+
+    def __enter__(self):
+        stack = _stack()
+        if _trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # The parent's peak so far survives our reset below
+            if stack:
+                stack[-1].max_seen = max(stack[-1].max_seen, peak)
+            tracemalloc.reset_peak()
+            self.start_memory = current
+        stack.append(self)
+        self.start_cpu = time.process_time()
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.perf_counter_ns()
+        cpu = time.process_time() - self.start_cpu
+        stack = _stack()
+        stack.pop()
+
+        args = dict(self.args, cpu_ms=round(cpu * 1000, 3))
+        if _trace_memory:
+            peak = max(tracemalloc.get_traced_memory()[1], self.max_seen)
+            if stack:
+                stack[-1].max_seen = max(stack[-1].max_seen, peak)
+            args['peak_kb'] = round(max(peak - self.start_memory, 0) / 1024, 1)
+        if exc_type is not None:
+            args['error'] = exc_type.__name__
+
+        _events.append({'name': self.name, 'cat': 'ford', 'ph': 'X',
+                        'ts': (self.start_ns - _origin_ns) / 1000,
+                        'dur': (end_ns - self.start_ns) / 1000,
+                        'pid': os.getpid(), 'tid': threading.get_ident(), 'args': args})
+        return False
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def enable(memory=True):
+    """Start recording spans; memory=True also tracks peak allocations with tracemalloc"""
+    global _enabled, _trace_memory, _origin_ns
+    if not _enabled:
+        _origin_ns = time.perf_counter_ns()
+    _trace_memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _enabled = True
+
+
+def disable():
+    global _enabled, _trace_memory
+    _enabled = False
+    if _trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _trace_memory = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def span(name, **args):
+    """
+    Context manager timing the enclosed block as one span.
+
+    Extra keyword arguments are stored with the span in the trace.
+    """
+    return _Span(name, args) if _enabled else _NULL_SPAN
+
+
+def traced(name=None):
+    """Decorator recording every call of the function as a span"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def events():
+    """Recorded spans in Chrome trace event format, in completion order"""
+    return list(_events)
+
+
+def export_chrome_trace(path):
+    """Write the recorded spans as a Chrome trace JSON file"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump({'traceEvents': _events, 'displayTimeUnit': 'ms'}, f)
+
+
+def summary():
+    """Per-span-name totals: [(name, calls, wall ms, cpu ms, peak kb)], slowest first"""
+    totals = {}
+    for event in _events:
+        name = event['name']
+        calls, wall, cpu, peak = totals.get(name, (0, 0.0, 0.0, 0.0))
+        totals[name] = (calls + 1, wall + event['dur'] / 1000, cpu + event['args']['cpu_ms'],
+                        max(peak, event['args'].get('peak_kb', 0.0)))
+    rows = [(name,) + values for name, values in totals.items()]
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+def print_summary(file=sys.stderr):
+    rows = summary()
+    if not rows:
+        return
+    width = max(len(row[0]) for row in rows)
+    print(f"\n{'span':<{width}}  {'calls':>5}  {'wall ms':>10}  {'cpu ms':>10}  {'peak KB':>10}",
+          file=file)
+    for name, calls, wall, cpu, peak in rows:
+        print(f"{name:<{width}}  {calls:>5}  {wall:>10.1f}  {cpu:>10.1f}  {peak:>10.1f}", file=file)
+
+
+def _export_at_exit(path):
+    if _events:
+        export_chrome_trace(path)
+        print_summary()
+        print(f"✓ Trace written: {path}", file=sys.stderr)
+
+
+# Worker processes inherit the environment but must not overwrite the
+# parent's trace file, so only the main process traces from FORD_TRACE
+if os.environ.get(TRACE_ENV) and multiprocessing.parent_process() is None:
+    enable()
+    atexit.register(_export_at_exit, os.environ[TRACE_ENV])
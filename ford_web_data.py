@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Ford Motor Company - Web Chart Dataset
+Precomputes the data behind the interactive charts in index.html: the yearly
+metrics each chart plots, a dense NPV-vs-discount-rate curve for Investments
+A and B, and the chart declarations themselves, written as one compact JSON
+file the page renders in the browser
+
+The dataset goes through the incremental build cache, so it is only rewritten
+when the columns it reads or the code producing it change.
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+from ford_build_cache import build
+from ford_data_loader import atomic_write_json, load_financial_data
+from ford_finance import calculate_pv_annuity
+from ford_metrics import OUTLINE_RATIOS, add_ratios
+from ford_monte_carlo import INVESTMENTS
+
+DATASET_PATH = os.path.join('assets', 'ford_dataset.json')
+
+# Dense NPV curve: discount rates 0%..NPV_RATE_MAX in NPV_RATE_STEP steps
+NPV_RATE_MAX = 0.20
+NPV_RATE_STEP = 0.0005
+
+# Series: (key, label, axis, unit, decimals, colour, dashed). Keys are
+# workbook/ratio columns, or investment names for the NPV chart ('x': 'rate').
+# 'zero' starts the left axis at zero; 'difference' adds an A − B tooltip row.
+# {first}-{last} in a title is filled in with the data's fiscal-year span.
+WEB_CHARTS = {
+    'visual_1': {
+        'title': 'Revenue & Margin Trends ({first}-{last})', 'x': 'year',
+        'left': 'Revenue ($B)', 'right': 'Margin (%)',
+        'series': [('Revenue ($B)', 'Revenue', 'left', '$B', 2, '#1f4e9c', False),
+                   ('Operating Margin %', 'Operating Margin', 'right', '%', 2, '#c0392b', True),
+                   ('Net Margin %', 'Net Margin', 'right', '%', 2, '#27ae60', True)],
+    },
+    'visual_2': {
+        'title': 'Cash Generation ({first}-{last})', 'x': 'year', 'left': '$ Billions', 'zero': True,
+        'series': [('Cash Flow from Ops ($B)', 'Cash Flow from Ops', 'left', '$B', 2, '#1f4e9c', False),
+                   ('Capex ($B)', 'Capex', 'left', '$B', 2, '#c0392b', False),
+                   ('Free Cash Flow ($B)', 'Free Cash Flow', 'left', '$B', 2, '#27ae60', False)],
+    },
+    'visual_3': {
+        'title': 'Leverage & Liquidity ({first}-{last})', 'x': 'year',
+        'left': '$ Billions', 'right': 'Current Ratio (x)', 'zero': True,
+        'series': [('Total Debt ($B)', 'Total Debt', 'left', '$B', 1, '#c0392b', False),
+                   ('Cash & Equivalents ($B)', 'Cash & Equivalents', 'left', '$B', 1, '#27ae60', False),
+                   ('Current Ratio', 'Current Ratio', 'right', 'x', 2, '#1f4e9c', True)],
+    },
+    'visual_4': {
+        'title': 'Operating vs Net Income ({first}-{last})', 'x': 'year', 'left': '$ Billions',
+        'zero': True,
+        'series': [('Operating Income ($B)', 'Operating Income', 'left', '$B', 2, '#1f4e9c', False),
+                   ('Net Income ($B)', 'Net Income', 'left', '$B', 2, '#e67e22', False)],
+    },
+    'visual_5': {
+        'title': 'Investment NPV Across Discount Rates', 'x': 'rate',
+        'left': 'Present Value ($M)', 'zero': True, 'difference': ['A', 'B'],
+        'series': [('A', 'Investment A ($50M × 20 years)', 'left', '$M', 1, '#1f4e9c', False),
+                   ('B', 'Investment B ($40M × 12 years)', 'left', '$M', 1, '#c0392b', False)],
+    },
+}
+
+
+def year_columns(charts=WEB_CHARTS):
+    """Workbook/ratio columns plotted by the yearly charts, in first-use order"""
+    return list(dict.fromkeys(series[0] for chart in charts.values() if chart['x'] == 'year'
+                              for series in chart['series']))
+
+
+DATASET_COLUMNS = ['Year Ended'] + year_columns()
+
+
+def npv_curve(rate_max=NPV_RATE_MAX, rate_step=NPV_RATE_STEP):
+    """Discount rates and {investment: present values ($M)} on an even grid"""
+    count = int(round(rate_max / rate_step)) + 1
+    rates = np.arange(count) * rate_step
+    return rates, {name: calculate_pv_annuity(investment.payment, rates, investment.years)
+                   for name, investment in INVESTMENTS.items()}
+
+
+def build_dataset(df, charts=WEB_CHARTS, rate_max=NPV_RATE_MAX, rate_step=NPV_RATE_STEP):
+    """
+    The dataset as a dict of plain lists.
+
+    Values are rounded to each series' display precision plus one digit. The
+    NPV rate grid is stored as [start, step, count] rather than spelled out.
+    """
+    decimals = {}
+    for chart in charts.values():
+        for key, _, _, _, places, _, _ in chart['series']:
+            decimals[key] = max(decimals.get(key, 0), places + 1)
+
+    rates, curves = npv_curve(rate_max, rate_step)
+    span = {'first': int(df['Year Ended'].min()), 'last': int(df['Year Ended'].max())}
+    specs = {}
+    for name, chart in charts.items():
+        specs[name] = {key: value for key, value in chart.items() if key != 'series'}
+        specs[name]['title'] = chart['title'].format(**span)
+        specs[name]['series'] = [
+            {'key': key, 'label': label, 'axis': axis, 'unit': unit, 'decimals': places,
+             'color': color, 'dashed': dashed}
+            for key, label, axis, unit, places, color, dashed in chart['series']]
+
+    return {
+        'years': [int(year) for year in df['Year Ended']],
+        'metrics': {column: [round(float(value), decimals[column]) for value in df[column]]
+                    for column in year_columns(charts)},
+        'npv': {'rates': [0.0, rate_step, len(rates)],
+                **{name: [round(float(value), decimals[name]) for value in values]
+                   for name, values in curves.items()}},
+        'charts': specs,
+    }
+
+
+def write_dataset(df, path=DATASET_PATH, charts=WEB_CHARTS, rate_max=NPV_RATE_MAX,
+                  rate_step=NPV_RATE_STEP):
+    """Write the dataset as minified JSON"""
+    atomic_write_json(path, build_dataset(df, charts, rate_max, rate_step),
+                      separators=(',', ':'), ensure_ascii=False)
+
+
+# Build fingerprint inputs besides the data columns
+DATASET_PARAMS = {'charts': WEB_CHARTS, 'rate_max': NPV_RATE_MAX, 'rate_step': NPV_RATE_STEP}
+DATASET_CODE = [write_dataset, build_dataset, year_columns, npv_curve, calculate_pv_annuity]
+
+
+def build_web_data(df, force=False, manifest=None):
+    """Rewrite the dataset if stale; returns True when it was rebuilt"""
+    return build(DATASET_PATH, write_dataset, df, DATASET_COLUMNS, params=DATASET_PARAMS,
+                 code=DATASET_CODE, manifest=manifest, force=force)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the dataset behind the interactive charts")
+    parser.add_argument('--force', action='store_true', help="rewrite the dataset")
+    args = parser.parse_args()
+
+    df = load_financial_data()
+    add_ratios(df, OUTLINE_RATIOS)
+    rebuilt = build_web_data(df, force=args.force)
+    status = 'written' if rebuilt else 'unchanged'
+    print(f"✓ {DATASET_PATH} {status} ({os.path.getsize(DATASET_PATH) / 1024:.1f} KB)")
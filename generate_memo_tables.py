@@ -1,160 +1,205 @@
 #!/usr/bin/env python3
 """
 Generate tables for Ford Motor Company Executive Memorandum
+
+Each table's columns and precision are declared once in MEMO_TABLES, with
+Table 6's year count and latest fiscal year filled in from the data. The
+console grid and the optional Markdown, HTML and DOCX exports all come from
+the same render pass, so the memo no longer needs tables pasted by hand.
 """
 
-import pandas as pd
+import argparse
+
 import numpy as np
 
-# Load the financial data
-df = pd.read_excel('Ford_10K_Financial_Ratios_2015_2024.xlsx')
-
-# Calculate additional metrics
-df['Operating Margin %'] = (df['Operating Income ($B)'] / df['Revenue ($B)']) * 100
-df['Net Margin %'] = (df['Net Income ($B)'] / df['Revenue ($B)']) * 100
-df['Gross Margin %'] = ((df['Revenue ($B)'] - df['COGS ($B)']) / df['Revenue ($B)']) * 100
-df['Free Cash Flow ($B)'] = df['Cash Flow from Ops ($B)'] - df['Capex ($B)']
-df['Current Ratio'] = df['Current Assets ($B)'] / df['Current Liabilities ($B)']
-df['Debt to Equity'] = df['Total Debt ($B)'] / df['Shareholders Equity ($B)']
-df['ROE %'] = (df['Net Income ($B)'] / df['Shareholders Equity ($B)']) * 100
-df['ROA %'] = (df['Net Income ($B)'] / df['Total Assets ($B)']) * 100
-df['Interest Coverage'] = df['EBIT ($B)'] / df['Interest Expense ($B)']
-
-print("FORD MOTOR COMPANY - MEMO TABLES")
-print("="*50)
-
-# Table 1: Revenue & Profitability Summary
-print("\nTABLE 1: REVENUE & PROFITABILITY TRENDS")
-print("-"*60)
-revenue_table = df[['Year Ended', 'Revenue ($B)', 'Gross Margin %', 'Operating Margin %', 
-                    'Net Margin %', 'Net Income ($B)']].copy()
-revenue_table['Revenue ($B)'] = revenue_table['Revenue ($B)'].round(1)
-revenue_table['Gross Margin %'] = revenue_table['Gross Margin %'].round(1)
-revenue_table['Operating Margin %'] = revenue_table['Operating Margin %'].round(1)
-revenue_table['Net Margin %'] = revenue_table['Net Margin %'].round(1)
-revenue_table['Net Income ($B)'] = revenue_table['Net Income ($B)'].round(1)
-
-print(revenue_table.to_markdown(index=False, tablefmt="grid"))
-
-# Table 2: Cash Flow Analysis
-print("\n\nTABLE 2: CASH FLOW & CAPITAL EXPENDITURE ANALYSIS")
-print("-"*60)
-cashflow_table = df[['Year Ended', 'Cash Flow from Ops ($B)', 'Capex ($B)', 
-                     'Free Cash Flow ($B)', 'Cash & Equivalents ($B)']].copy()
-cashflow_table['Cash Flow from Ops ($B)'] = cashflow_table['Cash Flow from Ops ($B)'].round(1)
-cashflow_table['Capex ($B)'] = cashflow_table['Capex ($B)'].round(1)
-cashflow_table['Free Cash Flow ($B)'] = cashflow_table['Free Cash Flow ($B)'].round(1)
-cashflow_table['Cash & Equivalents ($B)'] = cashflow_table['Cash & Equivalents ($B)'].round(1)
-
-print(cashflow_table.to_markdown(index=False, tablefmt="grid"))
-
-# Table 3: Balance Sheet Health
-print("\n\nTABLE 3: BALANCE SHEET & DEBT STRUCTURE")
-print("-"*60)
-balance_sheet_table = df[['Year Ended', 'Total Assets ($B)', 'Total Debt ($B)', 
-                         'Shareholders Equity ($B)', 'Debt to Equity']].copy()
-balance_sheet_table['Total Assets ($B)'] = balance_sheet_table['Total Assets ($B)'].round(0)
-balance_sheet_table['Total Debt ($B)'] = balance_sheet_table['Total Debt ($B)'].round(0)
-balance_sheet_table['Shareholders Equity ($B)'] = balance_sheet_table['Shareholders Equity ($B)'].round(1)
-balance_sheet_table['Debt to Equity'] = balance_sheet_table['Debt to Equity'].round(1)
-
-print(balance_sheet_table.to_markdown(index=False, tablefmt="grid"))
-
-# Table 4: Liquidity & Leverage Metrics
-print("\n\nTABLE 4: LIQUIDITY & LEVERAGE RATIOS")
-print("-"*60)
-liquidity_table = df[['Year Ended', 'Current Ratio', 'Interest Coverage', 'ROE %', 'ROA %']].copy()
-liquidity_table['Current Ratio'] = liquidity_table['Current Ratio'].round(2)
-liquidity_table['Interest Coverage'] = liquidity_table['Interest Coverage'].round(1)
-liquidity_table['ROE %'] = liquidity_table['ROE %'].round(1)
-liquidity_table['ROA %'] = liquidity_table['ROA %'].round(1)
-
-print(liquidity_table.to_markdown(index=False, tablefmt="grid"))
-
-# Table 5: Investment NPV Analysis
-print("\n\nTABLE 5: INVESTMENT ALTERNATIVES NPV ANALYSIS")
-print("-"*60)
-
-def calculate_pv_annuity(payment, rate, years):
-    if rate == 0:
-        return payment * years
-    return payment * ((1 - (1 + rate)**(-years)) / rate)
-
-rates = [0.05, 0.08, 0.10, 0.12, 0.15]
-investment_data = []
-
-for rate in rates:
-    pv_a = calculate_pv_annuity(50, rate, 20)
-    pv_b = calculate_pv_annuity(40, rate, 12)
-    advantage = pv_a - pv_b
-    
-    investment_data.append({
-        'Discount Rate': f"{rate*100:.0f}%",
-        'Investment A NPV ($M)': f"{pv_a:.1f}",
-        'Investment B NPV ($M)': f"{pv_b:.1f}",
-        'NPV Advantage A ($M)': f"{advantage:.1f}"
-    })
-
-investment_table = pd.DataFrame(investment_data)
-print(investment_table.to_markdown(index=False, tablefmt="grid"))
-
-# Summary Statistics Table
-print("\n\nTABLE 6: 10-YEAR FINANCIAL SUMMARY STATISTICS")
-print("-"*60)
-summary_metrics = {
-    'Metric': [
-        'Revenue ($B)',
-        'Operating Margin (%)',
-        'Net Margin (%)', 
-        'Free Cash Flow ($B)',
-        'ROE (%)',
-        'Current Ratio',
-        'Debt to Equity'
-    ],
-    'Minimum': [
-        df['Revenue ($B)'].min(),
-        df['Operating Margin %'].min(),
-        df['Net Margin %'].min(),
-        df['Free Cash Flow ($B)'].min(),
-        df['ROE %'].min(),
-        df['Current Ratio'].min(),
-        df['Debt to Equity'].min()
-    ],
-    'Maximum': [
-        df['Revenue ($B)'].max(),
-        df['Operating Margin %'].max(),
-        df['Net Margin %'].max(),
-        df['Free Cash Flow ($B)'].max(),
-        df['ROE %'].max(),
-        df['Current Ratio'].max(),
-        df['Debt to Equity'].max()
-    ],
-    'Average': [
-        df['Revenue ($B)'].mean(),
-        df['Operating Margin %'].mean(),
-        df['Net Margin %'].mean(),
-        df['Free Cash Flow ($B)'].mean(),
-        df['ROE %'].mean(),
-        df['Current Ratio'].mean(),
-        df['Debt to Equity'].mean()
-    ],
-    'Latest (2024)': [
-        df.iloc[-1]['Revenue ($B)'],
-        df.iloc[-1]['Operating Margin %'],
-        df.iloc[-1]['Net Margin %'],
-        df.iloc[-1]['Free Cash Flow ($B)'],
-        df.iloc[-1]['ROE %'],
-        df.iloc[-1]['Current Ratio'],
-        df.iloc[-1]['Debt to Equity']
-    ]
+from ford_data_loader import load_financial_data
+from ford_finance import calculate_pv_annuity, crossover_rate
+from ford_incremental import current_aggregates
+from ford_metrics import MEMO_RATIOS, add_ratios
+from ford_monte_carlo import (DEFAULT_SEED, PERCENTILES, percentile_table, run_simulation,
+                              superiority_table)
+from ford_tables import TableSpec, column, render_table
+
+# Discount rates compared in Table 5
+NPV_RATES = [0.05, 0.08, 0.10, 0.12, 0.15]
+
+# Table 6 rows: (label, source column)
+SUMMARY_METRICS = [
+    ('Revenue ($B)', 'Revenue ($B)'),
+    ('Operating Margin (%)', 'Operating Margin %'),
+    ('Net Margin (%)', 'Net Margin %'),
+    ('Free Cash Flow ($B)', 'Free Cash Flow ($B)'),
+    ('ROE (%)', 'ROE %'),
+    ('Current Ratio', 'Current Ratio'),
+    ('Debt to Equity', 'Debt to Equity'),
+]
+
+MEMO_TABLES = {
+    'revenue': TableSpec('TABLE 1: REVENUE & PROFITABILITY TRENDS', [
+        column('Year Ended'), column('Revenue ($B)', 1), column('Gross Margin %', 1),
+        column('Operating Margin %', 1), column('Net Margin %', 1), column('Net Income ($B)', 1)]),
+    'cash_flow': TableSpec('TABLE 2: CASH FLOW & CAPITAL EXPENDITURE ANALYSIS', [
+        column('Year Ended'), column('Cash Flow from Ops ($B)', 1), column('Capex ($B)', 1),
+        column('Free Cash Flow ($B)', 1), column('Cash & Equivalents ($B)', 1)]),
+    'balance_sheet': TableSpec('TABLE 3: BALANCE SHEET & DEBT STRUCTURE', [
+        column('Year Ended'), column('Total Assets ($B)', 0), column('Total Debt ($B)', 0),
+        column('Shareholders Equity ($B)', 1), column('Debt to Equity', 1)]),
+    'liquidity': TableSpec('TABLE 4: LIQUIDITY & LEVERAGE RATIOS', [
+        column('Year Ended'), column('Current Ratio', 2), column('Interest Coverage', 1),
+        column('ROE %', 1), column('ROA %', 1)]),
+    'npv': TableSpec('TABLE 5: INVESTMENT ALTERNATIVES NPV ANALYSIS', [
+        column('Discount Rate'), column('Investment A NPV ($M)', 1),
+        column('Investment B NPV ($M)', 1), column('NPV Advantage A ($M)', 1)]),
+    'monte_carlo': TableSpec('TABLE 5A: MONTE CARLO NPV DISTRIBUTION', [
+        column('Series'), column('Mean', 1)] + [column(f'P{q}', 1) for q in PERCENTILES]),
+    'superiority': TableSpec('TABLE 5B: PROBABILITY INVESTMENT A OUTPERFORMS B', [
+        column('Discount Rate'), column('Paths'), column('P(A > B)', 3)]),
+    # {years} and {latest} are filled in from the data by memo_table_specs
+    'summary': TableSpec('TABLE 6: {years}-YEAR FINANCIAL SUMMARY STATISTICS', [
+        column('Metric'), column('Minimum', 1), column('Maximum', 1), column('Average', 1),
+        column('Latest ({latest})', 1, key='Latest')]),
 }
 
-summary_table = pd.DataFrame(summary_metrics)
-# Round numeric columns
-for col in ['Minimum', 'Maximum', 'Average', 'Latest (2024)']:
-    summary_table[col] = summary_table[col].round(1)
-
-print(summary_table.to_markdown(index=False, tablefmt="grid"))
 
-print("\n" + "="*50)
-print("Tables generated for executive memorandum")
\ No newline at end of file
+def memo_table_specs(df):
+    """MEMO_TABLES with the fiscal-year count and latest year of df in titles and headers"""
+    fields = {'years': len(df), 'latest': int(df['Year Ended'].iloc[-1])}
+    specs = {}
+    for name, spec in MEMO_TABLES.items():
+        columns = [col._replace(header=col.header.format(**fields)) for col in spec.columns]
+        specs[name] = TableSpec(spec.title.format(**fields), columns)
+    return specs
+
+
+def npv_table_data(rates=NPV_RATES):
+    """Table 5: Investment A ($50M × 20y) vs B ($40M × 12y) at each discount rate"""
+    rates = np.asarray(rates)
+    pv_a_values = calculate_pv_annuity(50, rates, 20)
+    pv_b_values = calculate_pv_annuity(40, rates, 12)
+    return {
+        'Discount Rate': [f"{rate*100:.0f}%" for rate in rates],
+        'Investment A NPV ($M)': pv_a_values,
+        'Investment B NPV ($M)': pv_b_values,
+        'NPV Advantage A ($M)': pv_a_values - pv_b_values,
+    }
+
+
+def summary_table_data(df, aggregates=None):
+    """
+    Table 6: minimum, maximum, average and latest value of each summary metric.
+    Read from df's running aggregates when given, else computed from df.
+    """
+    columns = [source for _, source in SUMMARY_METRICS]
+    if aggregates is not None:
+        return {
+            'Metric': [label for label, _ in SUMMARY_METRICS],
+            'Minimum': [aggregates.stat(col, 'min') for col in columns],
+            'Maximum': [aggregates.stat(col, 'max') for col in columns],
+            'Average': [aggregates.stat(col, 'mean') for col in columns],
+            'Latest': [aggregates.stat(col, 'last') for col in columns],
+        }
+    values = df[columns].to_numpy()
+    return {
+        'Metric': [label for label, _ in SUMMARY_METRICS],
+        'Minimum': values.min(axis=0),
+        'Maximum': values.max(axis=0),
+        'Average': values.mean(axis=0),
+        'Latest': values[-1],
+    }
+
+
+def render_memo_tables(df, formats=('grid',), document=None, aggregates=None):
+    """
+    Render every memo table in each format; df must already carry the
+    MEMO_RATIOS columns, and aggregates (if given) supplies Table 6.
+    Returns ({table name: {format: output}}, simulation).
+    """
+    specs = memo_table_specs(df)
+    simulation = run_simulation()
+    sources = {
+        'revenue': df,
+        'cash_flow': df,
+        'balance_sheet': df,
+        'liquidity': df,
+        'npv': npv_table_data(),
+        'monte_carlo': percentile_table(simulation),
+        'superiority': superiority_table(simulation),
+        'summary': summary_table_data(df, aggregates),
+    }
+    rendered = {}
+    for name, spec in specs.items():
+        if document is not None:
+            document.add_heading(spec.title.title(), level=2)
+        rendered[name] = render_table(spec, sources[name], formats, document)
+    return rendered, simulation
+
+
+def print_memo_tables(df, formats=('grid',), document=None, aggregates=None):
+    """Print the memo tables; returns the rendered tables for any extra formats"""
+    rendered, simulation = render_memo_tables(df, tuple(dict.fromkeys(('grid',) + tuple(formats))),
+                                              document, aggregates)
+    print("FORD MOTOR COMPANY - MEMO TABLES")
+    print("="*50)
+
+    for i, (name, spec) in enumerate(memo_table_specs(df).items()):
+        title = spec.title
+        if name == 'monte_carlo':
+            title += f" ({simulation['paths']:,} paths, seed {DEFAULT_SEED})"
+        print(("\n" if i == 0 else "\n\n") + title)
+        print("-"*60)
+        print(rendered[name]['grid'])
+
+        if name == 'npv':
+            crossover = crossover_rate(50, 20, 40, 12)
+            if np.isnan(crossover):
+                print("\nCrossover rate: none - Investment A has the higher NPV at every discount rate")
+            else:
+                print(f"\nCrossover rate: {crossover*100:.2f}% - Investment B has the higher NPV above it")
+
+    print("\n" + "="*50)
+    print("Tables generated for executive memorandum")
+    return rendered
+
+
+def write_exports(rendered, specs, markdown_path=None, html_path=None):
+    """
+    Write the Markdown and/or HTML renderings of every table to one file each,
+    headed by the titles in specs (from memo_table_specs)
+    """
+    if markdown_path:
+        with open(markdown_path, 'w', encoding='utf-8') as f:
+            f.write('\n\n'.join(f"### {specs[name].title}\n\n{output['markdown']}"
+                                for name, output in rendered.items()) + '\n')
+    if html_path:
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.write('\n\n'.join(f"<h3>{specs[name].title}</h3>\n{output['html']}"
+                                for name, output in rendered.items()) + '\n')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print and export the executive memo tables")
+    parser.add_argument('--markdown', metavar='PATH', help="also write the tables as Markdown")
+    parser.add_argument('--html', metavar='PATH', help="also write the tables as HTML")
+    parser.add_argument('--docx', metavar='PATH', help="also write the tables to a Word document")
+    args = parser.parse_args()
+
+    # Load the financial data
+    df = load_financial_data()
+
+    # Calculate additional metrics
+    add_ratios(df, MEMO_RATIOS)
+
+    formats = [fmt for fmt, path in [('markdown', args.markdown), ('html', args.html),
+                                     ('docx', args.docx)] if path]
+    document = None
+    if args.docx:
+        from docx import Document
+        document = Document()
+        document.add_heading('Ford Motor Company - Memo Tables', level=1)
+
+    rendered = print_memo_tables(df, formats, document, current_aggregates(df))
+    write_exports(rendered, memo_table_specs(df), args.markdown, args.html)
+    if document is not None:
+        document.save(args.docx)
+    for path in filter(None, [args.markdown, args.html, args.docx]):
+        print(f"✓ Tables written: {path}")